@@ -0,0 +1,27 @@
+"""Bundle translations/*.json into a single msgpack file loaded by I18nService.
+
+Run from the app directory: python -m scripts.compile_translations
+"""
+import json
+from pathlib import Path
+
+import msgpack
+
+from src.services.i18n_service import TRANSLATIONS_BUNDLE
+
+TRANSLATIONS_PATH = Path(__file__).resolve().parent.parent / "translations"
+
+
+def compile_translations(translations_path: Path = TRANSLATIONS_PATH) -> Path:
+    translations = {}
+    for lang_file in sorted(translations_path.glob("*.json")):
+        with open(lang_file, 'r', encoding='utf-8') as f:
+            translations[lang_file.stem] = json.load(f)
+
+    bundle_file = translations_path / TRANSLATIONS_BUNDLE
+    bundle_file.write_bytes(msgpack.packb(translations, use_bin_type=True))
+    return bundle_file
+
+
+if __name__ == "__main__":
+    print(f"Wrote {compile_translations()}")
@@ -263,34 +263,22 @@ async def export_leads(
     
     service = LeadService(LeadRepository(db))
     
-    # Get leads count for history (check how many records will be exported)
-    leads, record_count = await service.list_leads(
+    # Get leads count for history (the total is returned regardless of limit)
+    _, record_count = await service.list_leads(
         status=status,
         interested_policy=interested_policy,
         search=search,
         start_date=start_date,
         end_date=end_date,
-        limit=None,  # Get all matching leads for count
+        limit=1,
         offset=None,
     )
     
-    # Export leads
-    content = await service.export_leads(
-        format=format,
-        status=status,
-        interested_policy=interested_policy,
-        search=search,
-        start_date=start_date,
-        end_date=end_date,
-        decrypt=decrypt,
-    )
-    
-    # Log export history
+    # Prepare export history; it is only recorded once the export succeeds
     from src.repositories.export_history_repository import ExportHistoryRepository
     from src.models.export_history import ExportHistory
     import json as json_lib
     
-    export_repo = ExportHistoryRepository(db)
     filter_criteria = {
         "status": status,
         "interested_policy": interested_policy,
@@ -309,24 +297,73 @@ async def export_leads(
         filter_criteria=json_lib.dumps(filter_criteria) if filter_criteria else None,
         exported_by=current_user,
     )
-    await export_repo.create(export_history)
-    await db.flush()  # Flush but don't commit yet
     
-    from fastapi.responses import Response
+    from fastapi.responses import Response, StreamingResponse
     
-    content_type = "text/csv" if format == "csv" else "application/json"
     date_str = datetime.utcnow().strftime('%Y%m%d')
     filename = f"leads_export_{date_str}.{format}"
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    
+    if format == "csv":
+        # Stream CSV page by page instead of building the whole export in memory
+        return StreamingResponse(
+            _stream_csv_export(
+                export_history,
+                status=status,
+                interested_policy=interested_policy,
+                search=search,
+                start_date=start_date,
+                end_date=end_date,
+                decrypt=decrypt,
+            ),
+            media_type="text/csv",
+            headers=headers,
+        )
     
+    content = await service.export_leads(
+        format=format,
+        status=status,
+        interested_policy=interested_policy,
+        search=search,
+        start_date=start_date,
+        end_date=end_date,
+        decrypt=decrypt,
+    )
+    
+    # Log export history
+    await ExportHistoryRepository(db).create(export_history)
     await db.commit()  # Commit export history
     
     return Response(
         content=content,
-        media_type=content_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        media_type="application/json",
+        headers=headers,
     )
 
 
+async def _stream_csv_export(export_history, **filters):
+    """
+    Yield CSV export chunks, then record the export history.
+    
+    The generator runs after the request handler has returned, when the
+    request-scoped session is already closed, so it opens its own session.
+    The history row is committed only after the last chunk is produced.
+    """
+    from src.database import AsyncSessionLocal
+    from src.repositories.export_history_repository import ExportHistoryRepository
+    
+    db = AsyncSessionLocal()
+    try:
+        service = LeadService(LeadRepository(db))
+        async for chunk in service.export_leads_stream(**filters):
+            yield chunk
+        
+        await ExportHistoryRepository(db).create(export_history)
+        await db.commit()  # Commit export history
+    finally:
+        await db.close()
+
+
 class ExportHistoryOut(BaseModel):
     """Export history response model."""
     id: int
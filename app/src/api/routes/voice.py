@@ -20,6 +20,13 @@ tts_service = TTSService()
 session_manager = SessionManager()
 
 
+@router.on_event("shutdown")
+async def close_voice_services():
+    """Close pooled provider connections on shutdown."""
+    await stt_service.aclose()
+    await tts_service.aclose()
+
+
 @router.post("/transcribe")
 async def transcribe_audio(
     audio_file: UploadFile = File(...),
@@ -82,14 +89,21 @@ async def synthesize_speech(
         )
     
     try:
-        audio_bytes = await tts_service.synthesize_speech(
+        audio_stream = tts_service.synthesize_speech_stream(
             text,
             language or settings.default_language,
             voice or settings.tts_voice
         )
+        # Wait for the first chunk so provider errors still map to a 500
+        first_chunk = await audio_stream.__anext__()
+        
+        async def stream_audio():
+            yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
         
         return StreamingResponse(
-            iter([audio_bytes]),
+            stream_audio(),
             media_type="audio/mpeg",
             headers={
                 "Content-Disposition": "attachment; filename=speech.mp3"
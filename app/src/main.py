@@ -21,6 +21,7 @@ from src.middleware.error_handler import (
     ApplicationError,
 )
 from src.middleware.rate_limiter import RateLimitMiddleware
+from src.services.rate_limiter_service import RateLimiterService
 
 # Create FastAPI app
 app = FastAPI(
@@ -41,8 +42,21 @@ app.add_middleware(
 )
 
 # Rate limiting middleware (optional - can be disabled for development)
-if settings.enable_rate_limiting:
-    app.add_middleware(RateLimitMiddleware)
+rate_limiter = RateLimiterService() if settings.enable_rate_limiting else None
+if rate_limiter is not None:
+    app.add_middleware(RateLimitMiddleware, rate_limiter=rate_limiter)
+
+
+@app.on_event("startup")
+async def load_rate_limit_scripts():
+    """Preload rate limit Lua scripts so requests use EVALSHA from the start."""
+    if rate_limiter is None:
+        return
+    try:
+        await rate_limiter.load_scripts()
+    except Exception:
+        # Redis unavailable at startup; the limiter loads the script on first use
+        pass
 
 # Error handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
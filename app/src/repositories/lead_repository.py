@@ -1,5 +1,6 @@
+from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.lead import Lead
 from src.models.lead_status_history import LeadStatusHistory
@@ -38,14 +39,86 @@ class LeadRepository:
         Returns:
             Tuple of (leads list, total count)
         """
-        from datetime import datetime
-        from sqlalchemy import or_, func, and_
+        from sqlalchemy import func, and_
         
         # Build base query
         query = select(Lead)
         count_query = select(func.count(Lead.id))
         
-        # Apply filters
+        # Apply all conditions
+        conditions = self._filter_conditions(
+            status, interested_policy, search, start_date, end_date
+        )
+        if conditions:
+            query = query.where(and_(*conditions))
+            count_query = count_query.where(and_(*conditions))
+        
+        # Get total count
+        total_result = await self.session.execute(count_query)
+        total_count = total_result.scalar_one()
+        
+        # Apply ordering, limit, and offset (id breaks created_at ties)
+        query = query.order_by(Lead.created_at.desc(), Lead.id.desc())
+        
+        if limit:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+        
+        # Execute query
+        result = await self.session.execute(query)
+        leads = list(result.scalars().all())
+        
+        return leads, total_count
+
+    async def list_page(
+        self,
+        status: Optional[str] = None,
+        interested_policy: Optional[str] = None,
+        search: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 1000,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> List[Lead]:
+        """
+        Fetch one page of filtered leads using keyset pagination.
+        
+        Leads are ordered by (created_at, id) descending. Pass the
+        (created_at, id) of the last lead of the previous page as ``after``
+        to fetch the next one. Unlike list(), no total count is computed.
+        """
+        from sqlalchemy import and_, or_
+        
+        conditions = self._filter_conditions(
+            status, interested_policy, search, start_date, end_date
+        )
+        if after is not None:
+            after_created_at, after_id = after
+            conditions.append(or_(
+                Lead.created_at < after_created_at,
+                and_(Lead.created_at == after_created_at, Lead.id < after_id),
+            ))
+        
+        query = select(Lead)
+        if conditions:
+            query = query.where(and_(*conditions))
+        query = query.order_by(Lead.created_at.desc(), Lead.id.desc()).limit(limit)
+        
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _filter_conditions(
+        status: Optional[str],
+        interested_policy: Optional[str],
+        search: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> list:
+        """Build the WHERE conditions shared by list() and list_page()."""
+        from sqlalchemy import or_
+        
         conditions = []
         
         if status:
@@ -76,28 +149,7 @@ class LeadRepository:
             )
             conditions.append(search_condition)
         
-        # Apply all conditions
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total_count = total_result.scalar_one()
-        
-        # Apply ordering, limit, and offset
-        query = query.order_by(Lead.created_at.desc())
-        
-        if limit:
-            query = query.limit(limit)
-        if offset:
-            query = query.offset(offset)
-        
-        # Execute query
-        result = await self.session.execute(query)
-        leads = list(result.scalars().all())
-        
-        return leads, total_count
+        return conditions
 
     async def update(self, lead_id: int, updates: dict) -> Optional[Lead]:
         """Update lead with partial updates."""
@@ -160,16 +212,22 @@ class LeadRepository:
         lead_ids: List[int],
         new_status: str,
         changed_by: str,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        changed_at: Optional[datetime] = None,
     ) -> List[int]:
         """
         Bulk update status for multiple leads.
         
+        Issues a fixed number of statements regardless of batch size: one SELECT
+        for the previous statuses, one UPDATE ... WHERE id IN (...) and one
+        executemany INSERT into the status history.
+        
         Args:
             lead_ids: List of lead IDs to update
             new_status: New status value
             changed_by: User/admin who made the change
             notes: Optional notes for status change
+            changed_at: Timestamp shared by every history row (defaults to now)
         
         Returns:
             List of successfully updated lead IDs
@@ -187,33 +245,45 @@ class LeadRepository:
                 raise ValueError(f"Invalid status: {new_status}")
         else:
             status_enum = new_status
-            new_status = status_enum.value
+        new_status = status_enum.value
         
-        # Find all leads
-        query = select(Lead).where(Lead.id.in_(lead_ids))
-        result = await self.session.execute(query)
-        leads = list(result.scalars().all())
+        # Only leads whose status actually changes are updated and logged
+        result = await self.session.execute(
+            select(Lead.id, Lead.status).where(
+                Lead.id.in_(lead_ids), Lead.status != new_status
+            )
+        )
+        previous_statuses = {
+            lead_id: getattr(previous, "value", previous)
+            for lead_id, previous in result.all()
+        }
+        if not previous_statuses:
+            return []
         
-        updated_lead_ids = []
-        
-        # Update each lead and log status change
-        for lead in leads:
-            previous_status = lead.status.value if lead.status else None
-            
-            # Only update if status is different
-            if previous_status != new_status:
-                lead.status = status_enum
-                await self.session.flush()
-                
-                # Log status change for audit trail
-                await self.add_status_history(
-                    lead_id=lead.id,
-                    previous_status=previous_status,
-                    new_status=new_status,
-                    changed_by=changed_by,
-                    notes=notes
-                )
-                
-                updated_lead_ids.append(lead.id)
+        updated_lead_ids = list(previous_statuses)
+        changed_at = changed_at or datetime.utcnow()
+        
+        await self.session.execute(
+            update(Lead)
+            .where(Lead.id.in_(updated_lead_ids))
+            .values(status=new_status, updated_at=changed_at)
+            .execution_options(synchronize_session="fetch")
+        )
+        
+        # Log status changes for audit trail in a single executemany
+        await self.session.execute(
+            insert(LeadStatusHistory),
+            [
+                {
+                    "lead_id": lead_id,
+                    "previous_status": previous_status,
+                    "new_status": new_status,
+                    "changed_by": changed_by,
+                    "changed_at": changed_at,
+                    "notes": notes,
+                }
+                for lead_id, previous_status in previous_statuses.items()
+            ],
+        )
         
         return updated_lead_ids
@@ -23,6 +23,15 @@ class PolicyRepository:
         )
         return result.scalar_one_or_none()
 
+    async def find_by_ids(self, policy_ids: List[int]) -> List[Policy]:
+        """Fetch several policies in a single query (order is not guaranteed)."""
+        if not policy_ids:
+            return []
+        result = await self.session.execute(
+            select(Policy).where(Policy.id.in_(policy_ids))
+        )
+        return list(result.scalars().all())
+
     async def find_by_name(self, name: str) -> Optional[Policy]:
         result = await self.session.execute(
             select(Policy).where(Policy.name == name)
@@ -33,6 +42,7 @@ class PolicyRepository:
         self,
         provider: Optional[str] = None,
         search: Optional[str] = None,
+        exclude_provider: Optional[str] = None,
     ) -> List[Policy]:
         """
         List policies, optionally filtered by provider or searched by name.
@@ -40,6 +50,8 @@ class PolicyRepository:
         Args:
             provider: Filter by provider name (partial match)
             search: Search by policy name (partial match)
+            exclude_provider: Drop policies whose provider contains this name
+                              (case-insensitive partial match)
         """
         from sqlalchemy import or_
         
@@ -58,6 +70,11 @@ class PolicyRepository:
             else:
                 query = query.where(or_(*conditions))
         
+        if exclude_provider:
+            query = query.where(
+                ~Policy.provider.icontains(exclude_provider, autoescape=True)
+            )
+        
         query = query.order_by(Policy.created_at.desc())
         result = await self.session.execute(query)
         return list(result.scalars().all())
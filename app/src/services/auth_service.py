@@ -1,7 +1,7 @@
 """Authentication service for admin endpoints."""
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from src.config import settings
 
 
@@ -11,6 +11,8 @@ class AuthService:
     SECRET_KEY = settings.jwt_secret_key
     ALGORITHM = settings.jwt_algorithm
     ACCESS_TOKEN_EXPIRE_MINUTES = settings.jwt_expire_minutes
+    # Key object built once; passing the raw secret makes jose rebuild (and JSON-probe) it per call
+    SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
     
     def create_access_token(self, username: str) -> str:
         """Create JWT token."""
@@ -20,12 +22,12 @@ class AuthService:
             "exp": expire,
             "type": "access"
         }
-        return jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        return jwt.encode(to_encode, self.SIGNING_KEY, algorithm=self.ALGORITHM)
     
     def verify_token(self, token: str) -> Optional[str]:
         """Verify JWT token and return username."""
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.SIGNING_KEY, algorithms=[self.ALGORITHM])
             username: str = payload.get("sub")
             if username is None:
                 return None
@@ -36,7 +38,7 @@ class AuthService:
     def get_token_payload(self, token: str) -> Optional[dict]:
         """Get token payload without verification (for expiration check)."""
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.SIGNING_KEY, algorithms=[self.ALGORITHM])
             return payload
         except JWTError:
             return None
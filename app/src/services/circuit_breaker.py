@@ -0,0 +1,130 @@
+"""Circuit breaker for calls to external providers."""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+import openai
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+    pass
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """
+    Whether an exception means the provider itself is failing.
+
+    Providers wrap errors in a plain Exception, so the chain of causes is
+    searched for the original error. Transport errors, timeouts and 5xx
+    responses count; 4xx responses and validation errors (ValueError,
+    TypeError, LookupError) are the caller's fault and do not. Other errors
+    raised by a provider are counted.
+    """
+    while exc is not None:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if isinstance(exc, (httpx.TransportError, openai.APIConnectionError, asyncio.TimeoutError, OSError)):
+            return True
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        if isinstance(exc, openai.APIStatusError):
+            return exc.status_code >= 500
+        if isinstance(exc, (ValueError, TypeError, LookupError)):
+            return False
+        exc = exc.__cause__ or exc.__context__
+    return True
+
+
+class CircuitBreaker:
+    """
+    Fail fast after repeated provider failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    are rejected with CircuitOpenError for ``reset_timeout`` seconds. It then
+    goes half-open: exactly one trial call is let through and the others are
+    rejected until it settles. Success closes the circuit, failure opens it
+    again. Only errors for which ``is_failure`` returns True are counted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        is_failure: Callable[[BaseException], bool] = is_provider_failure,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        if self.opened_at is None:
+            return False
+        return self.trial_in_flight or time.monotonic() - self.opened_at < self.reset_timeout
+
+    def check(self) -> None:
+        """
+        Raise CircuitOpenError if the circuit is open.
+
+        Once the reset timeout has passed, the first caller becomes the
+        half-open trial and must settle it with record_success,
+        record_failure or record_error.
+        """
+        if self.opened_at is None:
+            return
+        if self.is_open:
+            remaining = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            raise CircuitOpenError(
+                f"{self.name} is unavailable after repeated failures; retry in {remaining:.0f}s"
+            )
+        self.trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.opened_at is not None:
+            logger.info(f"{self.name} circuit closed")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.trial_in_flight or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+            self.opened_at = time.monotonic()
+        self.trial_in_flight = False
+
+    def record_error(self, exc: BaseException) -> None:
+        """Record a call that raised, counting it only if it is a provider failure."""
+        if isinstance(exc, Exception) and self.is_failure(exc):
+            self.record_failure()
+        else:
+            # Cancelled or rejected for a non-provider reason: the trial, if
+            # any, proved nothing, so let the next caller try instead
+            self.trial_in_flight = False
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Await func() through the breaker."""
+        self.check()
+        try:
+            result = await func()
+        except BaseException as e:
+            self.record_error(e)
+            raise
+        self.record_success()
+        return result
@@ -109,26 +109,43 @@ class FileStorageService:
             leads: List of leads to export
             decrypt: If True, decrypt phone/NID for admin (requires EncryptionService)
         """
+        from src.services.encryption_service import EncryptionService
+        
+        encryption_service = EncryptionService() if decrypt else None
+        return self.encode_leads_csv(leads, encryption_service)
+    
+    def encode_leads_csv(
+        self,
+        leads: List[Lead],
+        encryption_service=None,
+        include_header: bool = True,
+    ) -> str:
+        """
+        Encode a batch of leads as CSV text.
+        
+        Args:
+            leads: Leads to encode
+            encryption_service: If given, phone/NID are decrypted; otherwise masked
+            include_header: Write the header row before the data rows
+        """
         import csv
         from io import StringIO
-        from src.services.encryption_service import EncryptionService
         
         output = StringIO()
         writer = csv.writer(output)
         
         # Header
-        writer.writerow([
-            "ID", "Name", "Phone", "NID", "Email", "Address", 
-            "Policy Interest", "Status", "Preferred Contact Time", "Notes",
-            "Conversation ID", "Created At", "Updated At"
-        ])
+        if include_header:
+            writer.writerow([
+                "ID", "Name", "Phone", "NID", "Email", "Address", 
+                "Policy Interest", "Status", "Preferred Contact Time", "Notes",
+                "Conversation ID", "Created At", "Updated At"
+            ])
         
         # Data rows
-        encryption_service = EncryptionService() if decrypt else None
-        
         for lead in leads:
             # Handle phone
-            if decrypt and encryption_service:
+            if encryption_service:
                 try:
                     phone = encryption_service.decrypt(lead.phone)
                 except:
@@ -137,7 +154,7 @@ class FileStorageService:
                 phone = "***"
             
             # Handle NID
-            if decrypt and encryption_service and lead.nid:
+            if encryption_service and lead.nid:
                 try:
                     nid = encryption_service.decrypt(lead.nid)
                 except:
@@ -153,7 +170,7 @@ class FileStorageService:
                 lead.email or "",
                 lead.address or "",
                 lead.interested_policy or "",
-                lead.status.value if lead.status else "new",
+                getattr(lead.status, "value", lead.status) or "new",
                 lead.preferred_contact_time or "",
                 lead.notes or "",
                 lead.conversation_id or "",
@@ -203,7 +220,7 @@ class FileStorageService:
                 "email": lead.email,
                 "address": lead.address,
                 "interested_policy": lead.interested_policy,
-                "status": lead.status.value if lead.status else "new",
+                "status": getattr(lead.status, "value", lead.status) or "new",
                 "preferred_contact_time": lead.preferred_contact_time,
                 "notes": lead.notes,
                 "conversation_id": lead.conversation_id,
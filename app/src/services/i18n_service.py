@@ -2,6 +2,15 @@
 from typing import Dict, Optional
 from pathlib import Path
 import json
+import sys
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - bundle support is optional
+    msgpack = None
+
+# Prebuilt bundle of every language, produced by scripts/compile_translations.py
+TRANSLATIONS_BUNDLE = "translations.msgpack"
 
 
 class I18nService:
@@ -13,9 +22,14 @@ class I18nService:
         self.translations: Dict[str, Dict[str, str]] = {}
         self.default_language = "en"
         self._load_translations()
+        self._intern_keys()
     
     def _load_translations(self):
         """Load translation files."""
+        # Prefer the compiled bundle: one read and one binary parse for all languages
+        if self._load_bundle():
+            return
+        
         # Load default English translations
         default_file = self.translations_path / "en.json"
         if default_file.exists():
@@ -32,6 +46,27 @@ class I18nService:
                 with open(lang_file, 'r', encoding='utf-8') as f:
                     self.translations[lang_file.stem] = json.load(f)
     
+    def _load_bundle(self) -> bool:
+        """Load all languages from the compiled bundle if it is available."""
+        bundle_file = self.translations_path / TRANSLATIONS_BUNDLE
+        if msgpack is None or not bundle_file.exists():
+            return False
+        try:
+            translations = msgpack.unpackb(bundle_file.read_bytes(), raw=False)
+        except (ValueError, msgpack.UnpackException):
+            return False
+        if "en" not in translations:
+            return False
+        self.translations = translations
+        return True
+    
+    def _intern_keys(self):
+        """Intern language codes and keys so lookups with literal keys compare by identity."""
+        self.translations = {
+            sys.intern(lang): {sys.intern(key): value for key, value in entries.items()}
+            for lang, entries in self.translations.items()
+        }
+    
     def _get_default_translations(self) -> Dict[str, str]:
         """Get default English translations."""
         return {
@@ -56,6 +91,8 @@ class I18nService:
         lang_file = self.translations_path / f"{language}.json"
         with open(lang_file, 'w', encoding='utf-8') as f:
             json.dump(self.translations[language], f, indent=2, ensure_ascii=False)
+        # The bundle is now stale; fall back to per-file loading until it is rebuilt
+        (self.translations_path / TRANSLATIONS_BUNDLE).unlink(missing_ok=True)
     
     def translate(self, key: str, language: Optional[str] = None, **kwargs) -> str:
         """Translate a key to the specified language."""
@@ -88,9 +125,10 @@ class I18nService:
     
     def add_translation(self, language: str, key: str, value: str):
         """Add or update a translation."""
+        language = sys.intern(language)
         if language not in self.translations:
             self.translations[language] = {}
         
-        self.translations[language][key] = value
+        self.translations[language][sys.intern(key)] = value
         self._save_translations(language)
 
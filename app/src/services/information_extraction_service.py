@@ -4,6 +4,26 @@ from src.llm.providers.llm_provider import LLMProvider
 import re
 
 
+_EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+# Searched on its own as well: a name match starting earlier would otherwise
+# consume the start of the address ("I'm john@x.com")
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+
+# Age, email, phone and name patterns fused into one alternation so the fallback
+# extractor walks the message once; ``match.lastgroup`` tells which entity matched.
+# Age precedes phone so "35 years old" is not read as digits, and email precedes
+# phone so digits inside an address are consumed with it.
+_FUSED_ENTITY_PATTERN = re.compile(
+    r"(?P<age>\b(?P<age_before>\d{2})\s*(?:years?\s*old|age|aged)"
+    r"|\b(?:age|aged)\s*(?P<age_after>\d{2})\b)"
+    rf"|(?P<email>{_EMAIL_PATTERN})"
+    r"|(?P<phone>\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})"
+    r"|(?P<name_intro>(?:i'?m|my name is|call me|i am)\s+(?P<name_a>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?))"
+    r"|(?P<name_signoff>^(?P<name_b>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+here|speaking))",
+    re.IGNORECASE,
+)
+
+
 class InformationExtractionService:
     """Service for extracting structured information from natural language."""
     
@@ -36,44 +56,33 @@ class InformationExtractionService:
         return extracted
     
     def _extract_with_regex(self, message: str, entity_types: List[str]) -> Dict:
-        """Fallback regex-based extraction."""
+        """Fallback regex-based extraction (single pass over the message)."""
         extracted = {}
+        wanted = {"age", "phone", "email", "name"}.intersection(entity_types)
         
-        # Age extraction
-        if "age" in entity_types:
-            age_pattern = r'\b(\d{2})\s*(?:years?\s*old|age|aged)|\b(?:age|aged)\s*(\d{2})\b'
-            age_match = re.search(age_pattern, message.lower())
-            if age_match:
-                age = int(age_match.group(1) or age_match.group(2))
-                if 18 <= age <= 100:
-                    extracted["age"] = age
-        
-        # Phone extraction
-        if "phone" in entity_types:
-            phone_pattern = r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'
-            phone_match = re.search(phone_pattern, message)
-            if phone_match:
-                extracted["phone"] = phone_match.group(0)
-        
-        # Email extraction
-        if "email" in entity_types:
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_match = re.search(email_pattern, message)
+        if "email" in wanted:
+            email_match = _EMAIL_RE.search(message)
             if email_match:
                 extracted["email"] = email_match.group(0)
         
-        # Name extraction (simple: look for capitalized words)
-        if "name" in entity_types:
-            # Look for patterns like "I'm John" or "My name is John"
-            name_patterns = [
-                r"(?:i'?m|my name is|call me|i am)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-                r"^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+here|speaking)"
-            ]
-            for pattern in name_patterns:
-                name_match = re.search(pattern, message, re.IGNORECASE)
-                if name_match:
-                    extracted["name"] = name_match.group(1)
-                    break
+        for match in _FUSED_ENTITY_PATTERN.finditer(message):
+            kind = match.lastgroup
+            if kind == "name_intro" or kind == "name_signoff":
+                kind = "name"
+            if kind not in wanted or kind in extracted:
+                continue
+            
+            if kind == "age":
+                age = int(match.group("age_before") or match.group("age_after"))
+                if 18 <= age <= 100:
+                    extracted["age"] = age
+            elif kind == "name":
+                extracted["name"] = match.group("name_a") or match.group("name_b")
+            else:
+                extracted[kind] = match.group(0)
+            
+            if len(extracted) == len(wanted):
+                break
         
         return extracted
     
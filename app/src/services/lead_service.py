@@ -1,9 +1,13 @@
-from typing import List, Optional
+from datetime import datetime
+from functools import cached_property
+from typing import AsyncIterator, List, Optional
 from src.models.lead import Lead, LeadStatus
 from src.repositories.lead_repository import LeadRepository
-from src.services.validation_service import ValidationService
-from src.services.encryption_service import EncryptionService
-from src.services.file_storage_service import FileStorageService
+
+_MASK = "***"
+
+# Number of leads fetched and encoded per chunk when streaming exports
+EXPORT_PAGE_SIZE = 1000
 
 
 class LeadValidationError(Exception):
@@ -16,9 +20,23 @@ class LeadValidationError(Exception):
 class LeadService:
     def __init__(self, repo: LeadRepository):
         self.repo = repo
-        self.validation_service = ValidationService()
-        self.encryption_service = EncryptionService()
-        self.file_storage = FileStorageService()
+
+    # Helper services are built on first use so read-only calls such as
+    # list_leads/get_lead skip Fernet key setup and storage directory creation.
+    @cached_property
+    def validation_service(self):
+        from src.services.validation_service import ValidationService
+        return ValidationService()
+
+    @cached_property
+    def encryption_service(self):
+        from src.services.encryption_service import EncryptionService
+        return EncryptionService()
+
+    @cached_property
+    def file_storage(self):
+        from src.services.file_storage_service import FileStorageService
+        return FileStorageService()
 
     async def create_lead(self, name: str, phone: str, nid: Optional[str] = None, 
                          address: Optional[str] = None, interested_policy: Optional[str] = None,
@@ -97,10 +115,10 @@ class LeadService:
         try:
             phone = self.encryption_service.decrypt(encrypted_phone)
             if len(phone) > 4:
-                return f"{phone[:3]}***{phone[-4:]}"
-            return "***"
+                return "".join((phone[:3], _MASK, phone[-4:]))
+            return _MASK
         except:
-            return "***"
+            return _MASK
     
     async def export_leads(
         self,
@@ -127,6 +145,19 @@ class LeadService:
         Returns:
             Exported data as string
         """
+        if format == "csv":
+            chunks = [
+                chunk async for chunk in self.export_leads_stream(
+                    status=status,
+                    interested_policy=interested_policy,
+                    search=search,
+                    start_date=start_date,
+                    end_date=end_date,
+                    decrypt=decrypt,
+                )
+            ]
+            return b"".join(chunks).decode("utf-8")
+        
         leads, _ = await self.list_leads(
             status=status,
             interested_policy=interested_policy,
@@ -137,13 +168,53 @@ class LeadService:
             offset=None,
         )
         
-        if format == "csv":
-            return await self.file_storage.export_leads_to_csv(leads, decrypt=decrypt)
-        elif format == "json":
+        if format == "json":
             return await self.file_storage.export_leads_to_json(leads, decrypt=decrypt)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    async def export_leads_stream(
+        self,
+        status: Optional[str] = None,
+        interested_policy: Optional[str] = None,
+        search: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        decrypt: bool = False,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream leads as UTF-8 encoded CSV chunks, one page of leads at a time.
+        
+        Peak memory is bounded by page_size rather than the number of matching
+        leads, so the result can be passed straight to a StreamingResponse.
+        """
+        encryption_service = self.encryption_service if decrypt else None
+        include_header = True
+        after = None
+        
+        while True:
+            # Keyset paging on (created_at, id): no COUNT(*) per page and no
+            # rows skipped or repeated when created_at values tie
+            leads = await self.repo.list_page(
+                status=status,
+                interested_policy=interested_policy,
+                search=search,
+                start_date=start_date,
+                end_date=end_date,
+                limit=page_size,
+                after=after,
+            )
+            if leads or include_header:
+                yield self.file_storage.encode_leads_csv(
+                    leads, encryption_service, include_header=include_header
+                ).encode("utf-8")
+            include_header = False
+            
+            if len(leads) < page_size:
+                break
+            after = (leads[-1].created_at, leads[-1].id)
+
     async def update_lead(
         self,
         lead_id: int,
@@ -257,12 +328,13 @@ class LeadService:
                     f"{', '.join([s.value for s in LeadStatus])}"
                 )
         
-        # Bulk update status and log changes
+        # Bulk update status and log changes; all history rows share one timestamp
         updated_ids = await self.repo.bulk_update_status(
             lead_ids=lead_ids,
             new_status=status.value,
             changed_by=changed_by,
-            notes=notes.strip() if notes else None
+            notes=notes.strip() if notes else None,
+            changed_at=datetime.utcnow(),
         )
         
         return updated_ids
@@ -57,16 +57,10 @@ class PolicyService:
         Returns:
             List of policies that are not from the company
         """
-        exclude_name = (exclude_provider or settings.company_name).lower()
+        exclude_name = exclude_provider or settings.company_name
         
-        all_policies = await self.repo.list()
-        # Filter out company policies (case-insensitive partial match)
-        competitor_policies = [
-            p for p in all_policies
-            if exclude_name not in p.provider.lower()
-        ]
-        
-        return competitor_policies
+        # Filter out company policies in SQL (case-insensitive partial match)
+        return await self.repo.list(exclude_provider=exclude_name)
 
     async def list_company_policies(self, company_provider: Optional[str] = None) -> List[Policy]:
         """
@@ -92,43 +86,59 @@ class PolicyService:
         Returns:
             Dictionary with comparison data
         """
-        policies = []
-        for policy_id in policy_ids:
-            policy = await self.repo.find_by_id(policy_id)
-            if policy:
-                policies.append(policy)
+        # One query for all ids, then restore the requested order
+        found = {p.id: p for p in await self.repo.find_by_ids(policy_ids)}
+        policies = [found[policy_id] for policy_id in policy_ids if policy_id in found]
         
         if len(policies) < 2:
             raise ValueError("At least 2 policies are required for comparison")
         
-        # Build comparison data
+        # Build the per-policy rows and the range statistics in a single pass
+        first = policies[0]
+        coverage_min = coverage_max = first.coverage_amount
+        premium_min = premium_max = float(first.monthly_premium)
+        term_min = term_max = first.term_years
+        medical_exam_count = 0
+        rows = []
+        
+        for p in policies:
+            coverage = p.coverage_amount
+            premium = float(p.monthly_premium)
+            term = p.term_years
+            medical_exam = p.medical_exam_required
+            
+            if coverage < coverage_min:
+                coverage_min = coverage
+            elif coverage > coverage_max:
+                coverage_max = coverage
+            if premium < premium_min:
+                premium_min = premium
+            elif premium > premium_max:
+                premium_max = premium
+            if term < term_min:
+                term_min = term
+            elif term > term_max:
+                term_max = term
+            if medical_exam:
+                medical_exam_count += 1
+            
+            rows.append({
+                "id": p.id,
+                "name": p.name,
+                "provider": p.provider,
+                "coverage_amount": coverage,
+                "monthly_premium": premium,
+                "term_years": term,
+                "medical_exam_required": medical_exam,
+            })
+        
         comparison = {
-            "policies": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "provider": p.provider,
-                    "coverage_amount": p.coverage_amount,
-                    "monthly_premium": float(p.monthly_premium),
-                    "term_years": p.term_years,
-                    "medical_exam_required": p.medical_exam_required,
-                }
-                for p in policies
-            ],
+            "policies": rows,
             "comparison_points": {
-                "coverage_range": {
-                    "min": min(p.coverage_amount for p in policies),
-                    "max": max(p.coverage_amount for p in policies),
-                },
-                "premium_range": {
-                    "min": float(min(p.monthly_premium for p in policies)),
-                    "max": float(max(p.monthly_premium for p in policies)),
-                },
-                "term_range": {
-                    "min": min(p.term_years for p in policies),
-                    "max": max(p.term_years for p in policies),
-                },
-                "medical_exam_required_count": sum(1 for p in policies if p.medical_exam_required),
+                "coverage_range": {"min": coverage_min, "max": coverage_max},
+                "premium_range": {"min": premium_min, "max": premium_max},
+                "term_range": {"min": term_min, "max": term_max},
+                "medical_exam_required_count": medical_exam_count,
             }
         }
         
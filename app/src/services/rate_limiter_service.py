@@ -1,9 +1,50 @@
 """Rate limiting service using Redis."""
-from typing import Dict, Tuple, Optional
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Tuple, Optional
 from redis import asyncio as redis_async
+from redis.exceptions import NoScriptError
 from src.config import settings
 
 
+# Atomically count the request and report the window state in one round trip.
+# KEYS[1] = counter key, ARGV[1] = max requests, ARGV[2] = window in milliseconds.
+# Returns {allowed, remaining, retry_after_ms}.
+RATE_LIMIT_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    ttl = tonumber(ARGV[2])
+end
+local max_requests = tonumber(ARGV[1])
+if current > max_requests then
+    return {0, 0, ttl}
+end
+return {1, max_requests - current, 0}
+"""
+
+
+# Limit types counted in-process and pushed to Redis periodically. A small
+# overshoot across workers is acceptable for these in exchange for no Redis
+# round trip on most requests.
+LOCAL_LIMIT_TYPES: FrozenSet[str] = frozenset({"auth_login", "lead_creation"})
+LOCAL_SYNC_EVERY = 16  # Push the local delta after this many requests...
+LOCAL_SYNC_INTERVAL = 1.0  # ...or after this many seconds, whichever comes first
+LOCAL_MAX_KEYS = 10_000  # Prune expired windows once this many keys are tracked
+
+
+@dataclass
+class _LocalWindow:
+    """In-process counter for one rate limit key."""
+    count: int
+    started_at: float
+    unsynced: int = 0
+    synced_at: float = 0.0
+    retry_at: float = 0.0  # After a failed sync, no new attempt before this time
+
+
 class RateLimiterService:
     """Rate limiting service using Redis for distributed rate limiting."""
     
@@ -21,6 +62,29 @@ class RateLimiterService:
             "lead_creation": (10, 60),  # 10 per minute
             "auth_login": (5, 60),  # 5 per minute
         }
+        # SHA of RATE_LIMIT_SCRIPT; set by load_scripts() at startup or on first use
+        self._script_sha: Optional[str] = None
+        self.local_limit_types = LOCAL_LIMIT_TYPES
+        self._local: Dict[str, _LocalWindow] = {}
+    
+    async def load_scripts(self) -> None:
+        """Load the rate limit script into Redis so each check only sends its SHA."""
+        self._script_sha = await self._redis.script_load(RATE_LIMIT_SCRIPT)
+    
+    async def _run_limit_script(self, redis_key: str, max_requests: int, window_ms: int):
+        """Run the rate limit script by SHA, loading it into Redis when needed."""
+        if self._script_sha is None:
+            await self.load_scripts()
+        try:
+            return await self._redis.evalsha(
+                self._script_sha, 1, redis_key, max_requests, window_ms
+            )
+        except NoScriptError:
+            # Script cache was flushed (e.g. Redis restart); reload and retry once
+            await self.load_scripts()
+            return await self._redis.evalsha(
+                self._script_sha, 1, redis_key, max_requests, window_ms
+            )
     
     async def check_limit(
         self,
@@ -47,32 +111,91 @@ class RateLimiterService:
         max_requests, window_seconds = self.limits[limit_type]
         redis_key = f"rate_limit:{limit_type}:{key}"
         
+        if limit_type in self.local_limit_types:
+            return await self._check_local_limit(redis_key, max_requests, window_seconds)
+        
         try:
-            # Get current count
-            current = await self._redis.get(redis_key)
-            count = int(current) if current else 0
+            # INCR, expiry and TTL lookup happen atomically in a single round trip
+            allowed, remaining, retry_after_ms = await self._run_limit_script(
+                redis_key, max_requests, window_seconds * 1000
+            )
             
-            if count >= max_requests:
-                # Rate limit exceeded
-                # Get TTL (time remaining in seconds)
-                ttl = await self._redis.ttl(redis_key)
-                retry_after = max(ttl, 0) if ttl > 0 else window_seconds
+            if not allowed:
+                # Rate limit exceeded; round the remaining window up to whole seconds
+                retry_after = math.ceil(retry_after_ms / 1000) if retry_after_ms > 0 else window_seconds
                 return False, 0, retry_after
             
-            # Increment counter
-            await self._redis.incr(redis_key)
-            if count == 0:
-                # First request in window, set expiration
-                await self._redis.expire(redis_key, window_seconds)
-            
-            remaining = max(0, max_requests - count - 1)
-            return True, remaining, 0
+            return True, int(remaining), 0
         
         except Exception as e:
             # If Redis fails, allow request (fail open)
             # In production, consider logging this
             return True, 999, 0
     
+    async def _check_local_limit(
+        self,
+        redis_key: str,
+        max_requests: int,
+        window_seconds: int,
+    ) -> Tuple[bool, int, int]:
+        """Count the request in-process, syncing with Redis every few requests."""
+        now = time.monotonic()
+        window = self._local.get(redis_key)
+        if window is None or now - window.started_at >= window_seconds:
+            if len(self._local) >= LOCAL_MAX_KEYS:
+                self._prune_local(now, window_seconds)
+            # synced_at=0 makes the first request of a window pick up the
+            # count other workers have already pushed to Redis
+            window = _LocalWindow(count=0, started_at=now)
+            self._local[redis_key] = window
+        
+        if window.count >= max_requests:
+            retry_after = math.ceil(window_seconds - (now - window.started_at))
+            return False, 0, max(retry_after, 1)
+        
+        window.count += 1
+        window.unsynced += 1
+        if now >= window.retry_at and (
+            window.unsynced >= LOCAL_SYNC_EVERY
+            or now - window.synced_at >= LOCAL_SYNC_INTERVAL
+        ):
+            await self._sync_local(redis_key, window, window_seconds, now)
+        
+        return True, max(0, max_requests - window.count), 0
+    
+    async def _sync_local(
+        self,
+        redis_key: str,
+        window: _LocalWindow,
+        window_seconds: int,
+        now: float,
+    ) -> None:
+        """Push the unsynced delta to Redis and adopt the cluster-wide count."""
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incrby(redis_key, window.unsynced)
+                pipe.expire(redis_key, window_seconds, nx=True)
+                total, _ = await pipe.execute()
+        except Exception:
+            # Redis unavailable: keep counting locally (fail open) and keep the
+            # delta for the next attempt, which waits a full sync interval so
+            # an outage does not put a Redis round trip on every request
+            window.synced_at = now
+            window.retry_at = now + LOCAL_SYNC_INTERVAL
+            return
+        window.unsynced = 0
+        window.synced_at = now
+        window.count = max(window.count, int(total))
+    
+    def _prune_local(self, now: float, window_seconds: int) -> None:
+        """Drop in-process windows that have already expired."""
+        expired = [
+            key for key, window in self._local.items()
+            if now - window.started_at >= window_seconds
+        ]
+        for key in expired:
+            del self._local[key]
+    
     async def get_limit_info(
         self,
         key: str,
@@ -93,19 +216,39 @@ class RateLimiterService:
         max_requests, window_seconds = self.limits[limit_type]
         redis_key = f"rate_limit:{limit_type}:{key}"
         
+        local_window = None
+        if limit_type in self.local_limit_types:
+            # Requests counted in-process may not have reached Redis yet
+            local_window = self._local.get(redis_key)
+            now = time.monotonic()
+            if local_window is not None and now - local_window.started_at >= window_seconds:
+                local_window = None
+        
         try:
-            current = await self._redis.get(redis_key)
+            # GET and TTL share one round trip
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.get(redis_key)
+                pipe.ttl(redis_key)
+                current, ttl = await pipe.execute()
             count = int(current) if current else 0
-            ttl = await self._redis.ttl(redis_key)
-            
-            return {
-                "limit": max_requests,
-                "remaining": max(0, max_requests - count),
-                "reset": max(0, ttl) if ttl > 0 else window_seconds
-            }
+            reset = max(0, ttl) if ttl > 0 else window_seconds
         except Exception:
-            # If Redis fails, return defaults
-            return {"limit": max_requests, "remaining": max_requests, "reset": 0}
+            if local_window is None:
+                # If Redis fails, return defaults
+                return {"limit": max_requests, "remaining": max_requests, "reset": 0}
+            count = 0
+            reset = 0
+        
+        if local_window is not None:
+            count = max(count + local_window.unsynced, local_window.count)
+            local_reset = math.ceil(window_seconds - (now - local_window.started_at))
+            reset = max(reset, local_reset)
+        
+        return {
+            "limit": max_requests,
+            "remaining": max(0, max_requests - count),
+            "reset": reset
+        }
     
     async def reset_limit(
         self,
@@ -114,6 +257,7 @@ class RateLimiterService:
     ) -> bool:
         """Reset rate limit for a key (useful for testing or admin operations)."""
         redis_key = f"rate_limit:{limit_type}:{key}"
+        self._local.pop(redis_key, None)
         try:
             await self._redis.delete(redis_key)
             return True
@@ -1,6 +1,7 @@
 """Retry service with exponential backoff for transient errors."""
 import asyncio
 import logging
+import random
 from typing import Callable, TypeVar, Optional, List, Any
 from functools import wraps
 import time
@@ -9,6 +10,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Dedicated generator for backoff jitter, separate from the global random state
+_jitter_rng = random.Random()
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -25,6 +29,11 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        # Backoff delay (before jitter) for each attempt, indexed by attempt - 1
+        self.delay_schedule = tuple(
+            min(initial_delay * (exponential_base ** i), max_delay)
+            for i in range(max_attempts)
+        )
 
 
 class RetryableError(Exception):
@@ -65,8 +74,8 @@ class RetryService:
         Raises:
             Last exception if all retries fail
         """
-        if retryable_exceptions is None:
-            retryable_exceptions = [Exception]
+        retryable_types = tuple(retryable_exceptions) if retryable_exceptions is not None else (Exception,)
+        non_retryable_types = tuple(non_retryable_exceptions or ())
         
         last_exception = None
         delay = self.config.initial_delay
@@ -88,15 +97,12 @@ class RetryService:
                 last_exception = e
                 
                 # Check if this exception should not be retried
-                if non_retryable_exceptions:
-                    if any(isinstance(e, exc_type) for exc_type in non_retryable_exceptions):
-                        logger.warning(f"{operation_name} failed with non-retryable error: {type(e).__name__}")
-                        raise
+                if non_retryable_types and isinstance(e, non_retryable_types):
+                    logger.warning(f"{operation_name} failed with non-retryable error: {type(e).__name__}")
+                    raise
                 
                 # Check if this exception is retryable
-                is_retryable = any(isinstance(e, exc_type) for exc_type in retryable_exceptions)
-                
-                if not is_retryable:
+                if not isinstance(e, retryable_types):
                     logger.warning(f"{operation_name} failed with non-retryable error: {type(e).__name__}")
                     raise
                 
@@ -109,16 +115,13 @@ class RetryService:
                     raise
                 
                 # Calculate delay with exponential backoff
-                delay = min(
-                    self.config.initial_delay * (self.config.exponential_base ** (attempt - 1)),
-                    self.config.max_delay
-                )
+                delay = self.config.delay_schedule[attempt - 1]
                 
                 # Add jitter to prevent thundering herd
                 if self.config.jitter:
-                    import random
                     jitter_amount = delay * 0.1  # 10% jitter
-                    delay = delay + random.uniform(-jitter_amount, jitter_amount)
+                    # Uniform in [-jitter_amount, jitter_amount) from a single draw
+                    delay += (2.0 * _jitter_rng.random() - 1.0) * jitter_amount
                     delay = max(0, delay)  # Ensure non-negative
                 
                 logger.warning(
@@ -150,22 +153,28 @@ def retry_with_backoff(
             ...
     """
     def decorator(func: Callable[[], T]) -> Callable[[], T]:
+        # Built once per decorated function rather than on every call
+        retry_service = RetryService(
+            RetryConfig(
+                max_attempts=max_attempts,
+                initial_delay=initial_delay,
+                max_delay=max_delay
+            )
+        )
+        operation_name = f"{func.__name__}"
+        retryable_types = tuple(retryable_exceptions) if retryable_exceptions is not None else None
+        non_retryable_types = tuple(non_retryable_exceptions) if non_retryable_exceptions else None
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            retry_service = RetryService(
-                RetryConfig(
-                    max_attempts=max_attempts,
-                    initial_delay=initial_delay,
-                    max_delay=max_delay
-                )
-            )
-            operation_name = f"{func.__name__}"
+            async def call():
+                return await func(*args, **kwargs)
+
             return await retry_service.retry_with_backoff(
-                lambda: func(*args, **kwargs),
+                call,
                 operation_name=operation_name,
-                retryable_exceptions=retryable_exceptions,
-                non_retryable_exceptions=non_retryable_exceptions
+                retryable_exceptions=retryable_types,
+                non_retryable_exceptions=non_retryable_types
             )
         return wrapper
     return decorator
-
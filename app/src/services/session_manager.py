@@ -5,12 +5,25 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-import json
+import orjson
 from redis import asyncio as redis_async
 
 from src.config import settings
 
 
+# Update last_activity and refresh the TTL only if the session hash still exists,
+# so touching an expired session does not leave a partial hash behind.
+# KEYS[1] = session key, ARGV[1] = encoded timestamp, ARGV[2] = TTL in seconds.
+TOUCH_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'last_activity', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
 class ConversationStage(str, Enum):
     INTRODUCTION = "introduction"
     QUALIFICATION = "qualification"
@@ -77,8 +90,17 @@ class SessionState:
     context_summary: str = ""
     awaiting_confirmation: bool = False  # Track if waiting for confirmation
     confirmation_attempts: int = 0  # Track number of confirmation attempts
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: Optional[datetime] = None  # Defaults to creation time
+    last_activity: Optional[datetime] = None  # Defaults to created_at
+
+    def __post_init__(self) -> None:
+        # Read the clock once for both timestamps instead of once per field
+        if self.created_at is None or self.last_activity is None:
+            now = datetime.now(timezone.utc)
+            if self.created_at is None:
+                self.created_at = now
+            if self.last_activity is None:
+                self.last_activity = now
 
 
 class SessionManager:
@@ -89,9 +111,12 @@ class SessionManager:
             settings.redis_url, password=settings.redis_password, decode_responses=True
         )
         self._ttl = settings.session_ttl
+        self._touch = self._redis.register_script(TOUCH_SCRIPT)
 
     def _key(self, session_id: str) -> str:
-        return f"session:{session_id}"
+        # Sessions are stored as hashes (one JSON-encoded value per field); the
+        # v2 prefix keeps them apart from the earlier single-string layout.
+        return f"session:v2:{session_id}"
 
     async def create_session(self, session_id: str, conversation_id: int) -> SessionState:
         state = SessionState(session_id=session_id, conversation_id=conversation_id)
@@ -99,28 +124,35 @@ class SessionManager:
         return state
 
     async def get_session(self, session_id: str) -> Optional[SessionState]:
-        raw = await self._redis.get(self._key(session_id))
+        raw = await self._redis.hgetall(self._key(session_id))
         if not raw:
             return None
-        data = json.loads(raw)
+        data = {field_name: orjson.loads(value) for field_name, value in raw.items()}
         return self._deserialize(data)
 
     async def save_session(self, state: SessionState) -> None:
-        payload = self._serialize(state)
-        await self._redis.setex(self._key(state.session_id), self._ttl, json.dumps(payload))
+        key = self._key(state.session_id)
+        mapping = {
+            field_name: orjson.dumps(value)
+            for field_name, value in self._serialize(state).items()
+        }
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
 
     async def delete_session(self, session_id: str) -> None:
         await self._redis.delete(self._key(session_id))
 
     async def touch(self, session_id: str) -> None:
-        state = await self.get_session(session_id)
-        if not state:
-            return
-        state.last_activity = datetime.now(timezone.utc)
-        await self.save_session(state)
+        now = orjson.dumps(datetime.now(timezone.utc).isoformat())
+        await self._touch(keys=[self._key(session_id)], args=[now, self._ttl])
 
     def _serialize(self, state: SessionState) -> Dict[str, Any]:
         def dt_to_str(dt: datetime) -> str:
+            # Timestamps are normally already UTC; only convert the exceptions
+            if dt.tzinfo is timezone.utc:
+                return dt.isoformat()
             return dt.astimezone(timezone.utc).isoformat()
 
         return {
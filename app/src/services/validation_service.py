@@ -1,9 +1,80 @@
 """Validation service for lead data and other inputs."""
 import re
-from typing import Optional
+import string
+from functools import lru_cache
+from typing import Optional, Tuple
 from pydantic import BaseModel
 
 
+_PHONE_CLEAN = re.compile(r'[\s\-\(\)]')
+_PHONE_INTL = re.compile(r'^\+\d{1,15}$')
+_PHONE_DIGITS = re.compile(r'^\d{10,15}$')
+
+# Deletion tables for the email scanner: an input made only of allowed
+# characters translates to the empty string.
+_ASCII_ALNUM = string.ascii_letters + string.digits
+_EMAIL_LOCAL_CHARS = str.maketrans('', '', _ASCII_ALNUM + '._%+-')
+_EMAIL_DOMAIN_CHARS = str.maketrans('', '', _ASCII_ALNUM + '.-')
+_EMAIL_TLD_CHARS = str.maketrans('', '', string.ascii_letters)
+_NID_SEPARATORS = str.maketrans('', '', ' -')
+_NID_DIGIT_CHARS = str.maketrans('', '', string.digits)
+_NID_ALNUM_CHARS = str.maketrans('', '', _ASCII_ALNUM + '_')
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_email(email: str) -> bool:
+    """
+    Linear-time check equivalent to
+    ^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$ without regex backtracking.
+    """
+    local, at, domain = email.partition('@')
+    if not at or not local or local.translate(_EMAIL_LOCAL_CHARS):
+        return False
+    dot = domain.rfind('.')
+    if dot < 1:
+        return False
+    tld = domain[dot + 1:]
+    return (
+        len(tld) >= 2
+        and not tld.translate(_EMAIL_TLD_CHARS)
+        and not domain[:dot].translate(_EMAIL_DOMAIN_CHARS)
+    )
+
+
+def _is_nid_digits(value: str) -> bool:
+    """str.isdigit() with an ASCII fast path."""
+    if value.isascii():
+        return bool(value) and not value.translate(_NID_DIGIT_CHARS)
+    return value.isdigit()
+
+
+def _is_nid_alnum(value: str) -> bool:
+    """Alphanumeric, allowing underscores, with an ASCII fast path."""
+    if value.isascii():
+        # strip() leaves something only if there is at least one alphanumeric
+        return not value.translate(_NID_ALNUM_CHARS) and bool(value.strip("_"))
+    return value.isalnum() or value.replace("_", "").isalnum()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_phone(phone: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return (normalized, error) for a phone number; exactly one is set."""
+    # Remove spaces and dashes
+    cleaned = _PHONE_CLEAN.sub('', phone.strip())
+    
+    # Check if starts with + (international format)
+    if cleaned.startswith('+'):
+        # E.164 format: + followed by 1-15 digits
+        if _PHONE_INTL.match(cleaned):
+            return cleaned, None
+        return None, "Phone number must be in international format: +1234567890"
+    # Allow digits only (10-15 digits)
+    if _PHONE_DIGITS.match(cleaned):
+        # Add + prefix for normalization
+        return f"+{cleaned}", None
+    return None, "Phone number must be 10-15 digits. Include country code: +1234567890"
+
+
 class ValidationResult(BaseModel):
     """Result of validation."""
     is_valid: bool
@@ -16,38 +87,20 @@ class ValidationService:
     
     def validate_phone_number(self, phone: str) -> ValidationResult:
         """Validate phone number format."""
-        # Remove spaces and dashes
-        cleaned = re.sub(r'[\s\-\(\)]', '', phone.strip())
-        
-        # Check if starts with + (international format)
-        if cleaned.startswith('+'):
-            # E.164 format: + followed by 1-15 digits
-            if re.match(r'^\+\d{1,15}$', cleaned):
-                return ValidationResult(is_valid=True, normalized=cleaned)
-            return ValidationResult(
-                is_valid=False,
-                errors=["Phone number must be in international format: +1234567890"]
-            )
-        else:
-            # Allow digits only (10-15 digits)
-            if re.match(r'^\d{10,15}$', cleaned):
-                # Add + prefix for normalization
-                normalized = f"+{cleaned}"
-                return ValidationResult(is_valid=True, normalized=normalized)
-            return ValidationResult(
-                is_valid=False,
-                errors=["Phone number must be 10-15 digits. Include country code: +1234567890"]
-            )
+        normalized, error = _normalize_phone(phone)
+        if error is not None:
+            return ValidationResult(is_valid=False, errors=[error])
+        return ValidationResult(is_valid=True, normalized=normalized)
     
     def validate_nid(self, nid: str, country: str = "default") -> ValidationResult:
         """Validate National ID format (country-specific)."""
         # Remove spaces and hyphens
-        cleaned = nid.strip().replace(" ", "").replace("-", "")
+        cleaned = nid.strip().translate(_NID_SEPARATORS)
         
         # Country-specific validation
         if country == "US":
             # SSN format: 9 digits
-            if len(cleaned) == 9 and cleaned.isdigit():
+            if len(cleaned) == 9 and _is_nid_digits(cleaned):
                 return ValidationResult(is_valid=True, normalized=cleaned)
             return ValidationResult(
                 is_valid=False,
@@ -55,7 +108,7 @@ class ValidationService:
             )
         elif country == "BD":
             # Bangladesh NID: 10 or 13 digits
-            if len(cleaned) in [10, 13] and cleaned.isdigit():
+            if len(cleaned) in [10, 13] and _is_nid_digits(cleaned):
                 return ValidationResult(is_valid=True, normalized=cleaned)
             return ValidationResult(
                 is_valid=False,
@@ -63,7 +116,7 @@ class ValidationService:
             )
         else:
             # Default: alphanumeric, 8-20 characters
-            if 8 <= len(cleaned) <= 20 and (cleaned.isalnum() or cleaned.replace("-", "").replace("_", "").isalnum()):
+            if 8 <= len(cleaned) <= 20 and _is_nid_alnum(cleaned):
                 return ValidationResult(is_valid=True, normalized=cleaned)
             return ValidationResult(
                 is_valid=False,
@@ -72,8 +125,7 @@ class ValidationService:
     
     def validate_email(self, email: str) -> ValidationResult:
         """Validate email format."""
-        pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-        if re.match(pattern, email.strip()):
+        if _is_valid_email(email.strip()):
             return ValidationResult(is_valid=True, normalized=email.strip().lower())
         return ValidationResult(
             is_valid=False,
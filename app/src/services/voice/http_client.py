@@ -0,0 +1,76 @@
+"""Shared HTTP client handling for voice providers."""
+from typing import Any, Optional
+
+import httpx
+import openai
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Long synthesis/transcription calls must not fail waiting for a pooled connection
+HTTP_TIMEOUT = httpx.Timeout(60.0, pool=None)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled client used by HTTP-based voice providers.
+    
+    Uses HTTP/2 when h2 is installed, so concurrent requests to the same TLS
+    host are multiplexed over one connection.
+    """
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE)
+
+
+def create_openai_client(api_key: Optional[str]) -> Any:
+    """
+    Create an AsyncOpenAI client on the aiohttp transport.
+    
+    Falls back to the SDK's default httpx transport when the ``openai[aiohttp]``
+    extra is not installed.
+    """
+    try:
+        http_client = openai.DefaultAioHttpClient()
+    except (AttributeError, RuntimeError):
+        # Older SDK without the aiohttp transport, or extra not installed
+        http_client = None
+    return openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+class PooledHTTPClientMixin:
+    """Lazily creates one httpx client per provider and reuses its connections."""
+
+    _client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class OpenAIClientMixin:
+    """Lazily creates one AsyncOpenAI client per provider and reuses it."""
+
+    api_key: Optional[str] = None
+    _client: Any = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            self._client = create_openai_client(self.api_key)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the OpenAI client and its connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
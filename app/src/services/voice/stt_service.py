@@ -1,10 +1,16 @@
 """Speech-to-Text service for voice input."""
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, BinaryIO
 from pathlib import Path
-import base64
+import asyncio
 import io
 
+from src.config import settings
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.retry_service import RetryConfig, RetryService
+from src.services.voice.http_client import OpenAIClientMixin, PooledHTTPClientMixin
+
 
 class STTProvider(ABC):
     """Abstract base class for Speech-to-Text providers."""
@@ -18,27 +24,42 @@ class STTProvider(ABC):
     async def transcribe_file(self, file_path: Path, language: Optional[str] = None) -> str:
         """Transcribe audio file to text."""
         pass
+    
+    async def aclose(self) -> None:
+        """Release any connections held by the provider."""
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
 
-class OpenAISTTProvider(STTProvider):
+class OpenAISTTProvider(OpenAIClientMixin, STTProvider):
     """OpenAI Whisper API provider for STT."""
     
     def __init__(self, api_key: Optional[str] = None, model: str = "whisper-1"):
         self.api_key = api_key
         self.model = model
         if not self.api_key:
-            from src.config import settings
             self.api_key = settings.openai_api_key
     
     async def transcribe(self, audio_data: bytes, language: Optional[str] = None) -> str:
         """Transcribe audio bytes to text using OpenAI Whisper."""
+        # Create a file-like object from bytes (shares the buffer, no copy)
+        audio_file = io.BytesIO(audio_data)
+        audio_file.name = "audio.webm"  # Set filename for OpenAI
+        return await self._transcribe(audio_file, language)
+    
+    async def transcribe_file(self, file_path: Path, language: Optional[str] = None) -> str:
+        """Transcribe audio file to text."""
+        # The SDK reads path uploads asynchronously, so no intermediate buffer is needed here
+        return await self._transcribe(Path(file_path), language)
+    
+    async def _transcribe(self, audio_file, language: Optional[str]) -> str:
         try:
-            import openai
-            client = openai.AsyncOpenAI(api_key=self.api_key)
-            
-            # Create a file-like object from bytes
-            audio_file = io.BytesIO(audio_data)
-            audio_file.name = "audio.webm"  # Set filename for OpenAI
+            client = self._get_client()
             
             # Transcribe
             transcript = await client.audio.transcriptions.create(
@@ -49,15 +70,9 @@ class OpenAISTTProvider(STTProvider):
             return transcript.text
         except Exception as e:
             raise Exception(f"OpenAI STT error: {str(e)}")
-    
-    async def transcribe_file(self, file_path: Path, language: Optional[str] = None) -> str:
-        """Transcribe audio file to text."""
-        with open(file_path, 'rb') as f:
-            audio_data = f.read()
-        return await self.transcribe(audio_data, language)
 
 
-class OllamaSTTProvider(STTProvider):
+class OllamaSTTProvider(PooledHTTPClientMixin, STTProvider):
     """Ollama Whisper model provider for STT (local)."""
     
     def __init__(self, base_url: str = "http://localhost:11434", model: str = "whisper"):
@@ -66,58 +81,74 @@ class OllamaSTTProvider(STTProvider):
     
     async def transcribe(self, audio_data: bytes, language: Optional[str] = None) -> str:
         """Transcribe audio using Ollama Whisper model."""
-        import httpx
-        
         try:
             # For Ollama, we'd need to use their API format
             # This is a placeholder - actual implementation depends on Ollama Whisper API
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Note: This assumes Ollama has a whisper endpoint
-                # Adjust based on actual Ollama Whisper API
-                response = await client.post(
-                    f"{self.base_url}/api/transcribe",
-                    json={
-                        "model": self.model,
-                        "audio": base64.b64encode(audio_data).decode(),
-                        "language": language
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("text", "")
+            client = self._get_client()
+            # Note: This assumes Ollama has a whisper endpoint
+            # Adjust based on actual Ollama Whisper API
+            # Upload raw audio as multipart instead of a base64 JSON field
+            response = await client.post(
+                f"{self.base_url}/api/transcribe",
+                files={"audio": ("audio.webm", audio_data, "audio/webm")},
+                data={"model": self.model, "language": language or ""}
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data.get("text", "")
         except Exception as e:
             raise Exception(f"Ollama STT error: {str(e)}")
     
     async def transcribe_file(self, file_path: Path, language: Optional[str] = None) -> str:
         """Transcribe audio file to text."""
-        with open(file_path, 'rb') as f:
-            audio_data = f.read()
+        audio_data = await asyncio.to_thread(Path(file_path).read_bytes)
         return await self.transcribe(audio_data, language)
 
 
+@lru_cache(maxsize=None)
+def _default_stt_provider() -> STTProvider:
+    """Create the default STT provider from settings, shared by all STTService instances."""
+    if settings.llm_provider == "openai" and settings.openai_api_key:
+        return OpenAISTTProvider(api_key=settings.openai_api_key)
+    else:
+        # Default to Ollama for local development
+        return OllamaSTTProvider(
+            base_url=settings.ollama_base_url,
+            model="whisper"
+        )
+
+
 class STTService:
     """Service for Speech-to-Text operations."""
     
     def __init__(self, provider: Optional[STTProvider] = None):
-        from src.config import settings
-        self.provider = provider or self._create_default_provider(settings)
-    
-    def _create_default_provider(self, settings) -> STTProvider:
-        """Create default STT provider based on settings."""
-        if settings.llm_provider == "openai" and settings.openai_api_key:
-            return OpenAISTTProvider(api_key=settings.openai_api_key)
-        else:
-            # Default to Ollama for local development
-            return OllamaSTTProvider(
-                base_url=settings.ollama_base_url,
-                model="whisper"
-            )
+        self.provider = provider or _default_stt_provider()
+        self.breaker = CircuitBreaker(f"STT provider {type(self.provider).__name__}")
+        self.retry_service = RetryService(RetryConfig(max_attempts=3, initial_delay=0.5, max_delay=4.0))
     
     async def transcribe_audio(self, audio_data: bytes, language: Optional[str] = None) -> str:
         """Transcribe audio data to text."""
-        return await self.provider.transcribe(audio_data, language)
+        async def call():
+            return await self.provider.transcribe(audio_data, language)
+        return await self._call_provider(call, "STT transcription")
     
     async def transcribe_file(self, file_path: Path, language: Optional[str] = None) -> str:
         """Transcribe audio file to text."""
-        return await self.provider.transcribe_file(file_path, language)
+        async def call():
+            return await self.provider.transcribe_file(file_path, language)
+        return await self._call_provider(call, "STT file transcription")
+    
+    async def _call_provider(self, call, operation_name: str) -> str:
+        """Run a provider call with retries, behind the circuit breaker."""
+        async def with_retry():
+            return await self.retry_service.retry_with_backoff(
+                call,
+                operation_name=operation_name,
+                non_retryable_exceptions=[CircuitOpenError]
+            )
+        return await self.breaker.call(with_retry)
+    
+    async def aclose(self) -> None:
+        """Close the provider's connections."""
+        await self.provider.aclose()
 
@@ -1,8 +1,26 @@
 """Text-to-Speech service for voice output."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, Tuple
 from pathlib import Path
+import asyncio
+import binascii
+import hashlib
 import io
+import time
+
+import orjson
+
+from src.config import settings
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.retry_service import RetryConfig, RetryService
+from src.services.voice.http_client import OpenAIClientMixin, PooledHTTPClientMixin
+
+
+TTS_STREAM_CHUNK_SIZE = 4096
+# Responses larger than this are decoded in a worker thread
+CPU_OFFLOAD_THRESHOLD = 256 * 1024
 
 
 class TTSProvider(ABC):
@@ -12,9 +30,25 @@ class TTSProvider(ABC):
     async def synthesize(self, text: str, language: Optional[str] = None, voice: Optional[str] = None) -> bytes:
         """Synthesize text to speech audio bytes."""
         pass
+    
+    async def synthesize_stream(
+        self, text: str, language: Optional[str] = None, voice: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield synthesized audio in chunks (whole clip by default)."""
+        yield await self.synthesize(text, language, voice)
+    
+    async def aclose(self) -> None:
+        """Release any connections held by the provider."""
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
 
-class OpenAITTSProvider(TTSProvider):
+class OpenAITTSProvider(OpenAIClientMixin, TTSProvider):
     """OpenAI TTS API provider."""
     
     def __init__(self, api_key: Optional[str] = None, model: str = "tts-1", voice: str = "alloy"):
@@ -22,32 +56,42 @@ class OpenAITTSProvider(TTSProvider):
         self.model = model
         self.default_voice = voice
         if not self.api_key:
-            from src.config import settings
             self.api_key = settings.openai_api_key
     
     async def synthesize(self, text: str, language: Optional[str] = None, voice: Optional[str] = None) -> bytes:
         """Synthesize text to speech using OpenAI TTS."""
         try:
-            import openai
-            client = openai.AsyncOpenAI(api_key=self.api_key)
+            client = self._get_client()
             
             response = await client.audio.speech.create(
                 model=self.model,
                 voice=voice or self.default_voice,
                 input=text
             )
+            # The SDK has already read the full body; take it as one buffer
+            return response.content
+        except Exception as e:
+            raise Exception(f"OpenAI TTS error: {str(e)}")
+    
+    async def synthesize_stream(
+        self, text: str, language: Optional[str] = None, voice: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized audio from OpenAI TTS as it is generated."""
+        try:
+            client = self._get_client()
             
-            # Read audio bytes
-            audio_bytes = b""
-            async for chunk in response:
-                audio_bytes += chunk
-            
-            return audio_bytes
+            async with client.audio.speech.with_streaming_response.create(
+                model=self.model,
+                voice=voice or self.default_voice,
+                input=text
+            ) as response:
+                async for chunk in response.iter_bytes(chunk_size=TTS_STREAM_CHUNK_SIZE):
+                    yield chunk
         except Exception as e:
             raise Exception(f"OpenAI TTS error: {str(e)}")
 
 
-class ElevenLabsTTSProvider(TTSProvider):
+class ElevenLabsTTSProvider(PooledHTTPClientMixin, TTSProvider):
     """ElevenLabs TTS API provider (alternative)."""
     
     def __init__(self, api_key: Optional[str] = None, voice_id: str = "21m00Tcm4TlvDq8ikWAM"):
@@ -56,33 +100,31 @@ class ElevenLabsTTSProvider(TTSProvider):
     
     async def synthesize(self, text: str, language: Optional[str] = None, voice: Optional[str] = None) -> bytes:
         """Synthesize text to speech using ElevenLabs."""
-        import httpx
-        
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"https://api.elevenlabs.io/v1/text-to-speech/{voice or self.voice_id}",
-                    headers={
-                        "Accept": "audio/mpeg",
-                        "Content-Type": "application/json",
-                        "xi-api-key": self.api_key or ""
-                    },
-                    json={
-                        "text": text,
-                        "model_id": "eleven_monolingual_v1",
-                        "voice_settings": {
-                            "stability": 0.5,
-                            "similarity_boost": 0.5
-                        }
+            client = self._get_client()
+            response = await client.post(
+                f"https://api.elevenlabs.io/v1/text-to-speech/{voice or self.voice_id}",
+                headers={
+                    "Accept": "audio/mpeg",
+                    "Content-Type": "application/json",
+                    "xi-api-key": self.api_key or ""
+                },
+                json={
+                    "text": text,
+                    "model_id": "eleven_monolingual_v1",
+                    "voice_settings": {
+                        "stability": 0.5,
+                        "similarity_boost": 0.5
                     }
-                )
-                response.raise_for_status()
-                return response.content
+                }
+            )
+            response.raise_for_status()
+            return response.content
         except Exception as e:
             raise Exception(f"ElevenLabs TTS error: {str(e)}")
 
 
-class GoogleTTSProvider(TTSProvider):
+class GoogleTTSProvider(PooledHTTPClientMixin, TTSProvider):
     """Google Cloud TTS provider (alternative)."""
     
     def __init__(self, api_key: Optional[str] = None):
@@ -90,49 +132,167 @@ class GoogleTTSProvider(TTSProvider):
     
     async def synthesize(self, text: str, language: Optional[str] = None, voice: Optional[str] = None) -> bytes:
         """Synthesize text to speech using Google TTS."""
-        import httpx
-        
         try:
             lang = language or "en-US"
             voice_name = voice or "en-US-Wavenet-D"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.api_key}",
-                    json={
-                        "input": {"text": text},
-                        "voice": {"languageCode": lang, "name": voice_name},
-                        "audioConfig": {"audioEncoding": "MP3"}
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                import base64
-                return base64.b64decode(data["audioContent"])
+            client = self._get_client()
+            response = await client.post(
+                f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.api_key}",
+                json={
+                    "input": {"text": text},
+                    "voice": {"languageCode": lang, "name": voice_name},
+                    "audioConfig": {"audioEncoding": "MP3"}
+                }
+            )
+            response.raise_for_status()
+            body = response.content
+            if len(body) > CPU_OFFLOAD_THRESHOLD:
+                # Parsing and decoding a long clip would stall the event loop
+                return await asyncio.to_thread(self._decode_audio, body)
+            return self._decode_audio(body)
         except Exception as e:
             raise Exception(f"Google TTS error: {str(e)}")
+    
+    @staticmethod
+    def _decode_audio(body: bytes) -> bytes:
+        data = orjson.loads(body)
+        return binascii.a2b_base64(data["audioContent"])
+
+
+TTS_CACHE_MAX_ENTRIES = 512
+TTS_CACHE_TTL = 86400.0  # seconds
+
+
+class TTSCache:
+    """In-process LRU cache of synthesized audio, with a TTL per entry."""
+    
+    def __init__(self, max_entries: int = TTS_CACHE_MAX_ENTRIES, ttl: float = TTS_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(provider: str, model: str, voice: Optional[str], language: Optional[str], text: str) -> str:
+        """Build the cache key for one synthesis request."""
+        raw = f"{provider}|{model}|{voice or ''}|{language or ''}|{text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: str, audio: bytes) -> None:
+        """Store audio under key, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + self.ttl, audio)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached audio."""
+        self._entries.clear()
+
+
+@lru_cache(maxsize=None)
+def _default_tts_provider() -> TTSProvider:
+    """Create the default TTS provider from settings, shared by all TTSService instances."""
+    if settings.llm_provider == "openai" and settings.openai_api_key:
+        return OpenAITTSProvider(api_key=settings.openai_api_key)
+    else:
+        # For local/dev, you might want to use a free TTS service
+        # or provide a simple fallback
+        # Defaulting to OpenAI for now
+        return OpenAITTSProvider(api_key=settings.openai_api_key)
 
 
 class TTSService:
     """Service for Text-to-Speech operations."""
     
-    def __init__(self, provider: Optional[TTSProvider] = None):
-        from src.config import settings
-        self.provider = provider or self._create_default_provider(settings)
+    def __init__(self, provider: Optional[TTSProvider] = None, cache: Optional[TTSCache] = None):
+        self.provider = provider or _default_tts_provider()
+        self.cache = cache if cache is not None else TTSCache()
+        # In-flight syntheses by cache key, so concurrent identical requests share one call
+        self._inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+        self.breaker = CircuitBreaker(f"TTS provider {type(self.provider).__name__}")
+        self.retry_service = RetryService(RetryConfig(max_attempts=3, initial_delay=0.5, max_delay=4.0))
     
-    def _create_default_provider(self, settings) -> TTSProvider:
-        """Create default TTS provider based on settings."""
-        if settings.llm_provider == "openai" and settings.openai_api_key:
-            return OpenAITTSProvider(api_key=settings.openai_api_key)
-        else:
-            # For local/dev, you might want to use a free TTS service
-            # or provide a simple fallback
-            # Defaulting to OpenAI for now
-            return OpenAITTSProvider(api_key=settings.openai_api_key)
+    def _cache_key(self, text: str, language: Optional[str], voice: Optional[str]) -> str:
+        return TTSCache.make_key(
+            type(self.provider).__name__,
+            getattr(self.provider, "model", ""),
+            voice,
+            language,
+            text,
+        )
     
     async def synthesize_speech(self, text: str, language: Optional[str] = None, voice: Optional[str] = None) -> bytes:
-        """Synthesize text to speech audio."""
-        return await self.provider.synthesize(text, language, voice)
+        """Synthesize text to speech audio, reusing cached audio for repeated requests."""
+        key = self._cache_key(text, language, voice)
+        audio = self.cache.get(key)
+        if audio is not None:
+            return audio
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._synthesize_and_cache(key, text, language, voice))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the synthesis for the others
+        return await asyncio.shield(task)
+    
+    async def _synthesize_and_cache(
+        self, key: str, text: str, language: Optional[str], voice: Optional[str]
+    ) -> bytes:
+        async def call():
+            return await self.provider.synthesize(text, language, voice)
+        
+        async def with_retry():
+            return await self.retry_service.retry_with_backoff(
+                call,
+                operation_name="TTS synthesis",
+                non_retryable_exceptions=[CircuitOpenError]
+            )
+        
+        audio = await self.breaker.call(with_retry)
+        self.cache.set(key, audio)
+        return audio
+    
+    async def synthesize_speech_stream(
+        self, text: str, language: Optional[str] = None, voice: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized audio, caching the full clip once it completes."""
+        key = self._cache_key(text, language, voice)
+        audio = self.cache.get(key)
+        if audio is not None:
+            yield audio
+            return
+        # Streams are not retried: chunks may already have reached the client
+        self.breaker.check()
+        chunks = []
+        try:
+            async for chunk in self.provider.synthesize_stream(text, language, voice):
+                chunks.append(chunk)
+                yield chunk
+        except BaseException as e:
+            # Includes GeneratorExit when the client stops reading early
+            self.breaker.record_error(e)
+            raise
+        self.breaker.record_success()
+        self.cache.set(key, b"".join(chunks))
+    
+    async def aclose(self) -> None:
+        """Close the provider's connections."""
+        await self.provider.aclose()
     
     def get_supported_voices(self) -> list[str]:
         """Get list of supported voices."""
@@ -3,6 +3,9 @@ import pytest
 from unittest.mock import Mock, AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.services.auth_service import AuthService
+from src.services.validation_service import ValidationService
+
 
 @pytest.fixture
 async def db_session():
@@ -15,3 +18,15 @@ async def db_session():
     session.close = AsyncMock()
     return session
 
+
+
+@pytest.fixture(scope="session")
+def auth_service():
+    """Shared AuthService instance (stateless, safe to reuse across tests)."""
+    return AuthService()
+
+
+@pytest.fixture(scope="session")
+def validation_service():
+    """Shared ValidationService instance (stateless, safe to reuse across tests)."""
+    return ValidationService()
@@ -65,14 +65,3 @@ async def test_detect_interest(db_session):
     
     interest = await service.detect_interest(session.session_id)
     assert interest in ["none", "low", "medium", "high"]
-
-
-@pytest.fixture
-async def db_session():
-    """Mock database session."""
-    session = AsyncMock()
-    session.add = Mock()
-    session.flush = AsyncMock()
-    session.commit = AsyncMock()
-    return session
-
@@ -0,0 +1,33 @@
+"""Tests for information extraction service."""
+import pytest
+
+from src.services.information_extraction_service import InformationExtractionService
+
+
+ENTITY_TYPES = ["age", "phone", "name", "address", "email"]
+
+
+@pytest.fixture(scope="module")
+def extraction_service():
+    """Extraction service for the regex fallback (no LLM calls)."""
+    return InformationExtractionService(llm_provider=None)
+
+
+def test_extract_with_regex_finds_all_entities(extraction_service):
+    """Test the fallback extracts each entity type from one message."""
+    result = extraction_service._extract_with_regex(
+        "My name is Jane Doe, 35 years old, call +1 555-123-4567 or jane@example.com",
+        ENTITY_TYPES,
+    )
+    assert result == {
+        "name": "Jane Doe",
+        "age": 35,
+        "phone": "+1 555-123-4567",
+        "email": "jane@example.com",
+    }
+
+
+def test_extract_with_regex_email_after_name_intro(extraction_service):
+    """Test an email is not lost when a name intro match starts before it."""
+    result = extraction_service._extract_with_regex("I'm john@x.com", ENTITY_TYPES)
+    assert result["email"] == "john@x.com"
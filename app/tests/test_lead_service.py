@@ -87,14 +87,3 @@ async def test_list_leads(db_session):
     
     assert len(leads) == 2
     assert leads[0].name == "John"
-
-
-@pytest.fixture
-async def db_session():
-    """Mock database session."""
-    session = AsyncMock()
-    session.add = Mock()
-    session.flush = AsyncMock()
-    session.commit = AsyncMock()
-    return session
-
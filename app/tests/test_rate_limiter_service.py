@@ -0,0 +1,40 @@
+"""Tests for rate limiter service."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import rate_limiter_service
+from src.services.rate_limiter_service import LOCAL_SYNC_EVERY, RateLimiterService
+
+
+class FailingRedis:
+    """Redis client whose pipelines always fail, counting the attempts."""
+    
+    def __init__(self):
+        self.attempts = 0
+    
+    def pipeline(self, transaction=True):
+        self.attempts += 1
+        raise ConnectionError("redis down")
+
+
+@pytest.mark.asyncio
+async def test_local_limit_backs_off_while_redis_is_down(monkeypatch):
+    """Test a Redis outage costs one sync attempt per interval, not one per request."""
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limiter_service, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    redis = FailingRedis()
+    limiter = RateLimiterService(redis_client=redis)
+    limiter.limits["lead_creation"] = (100, 60)
+    
+    for _ in range(LOCAL_SYNC_EVERY * 2):
+        allowed, _, _ = await limiter.check_limit("1.2.3.4", "lead_creation")
+        assert allowed is True
+    assert redis.attempts == 1
+    
+    # The delta is kept and pushed again once the sync interval has passed
+    clock[0] += rate_limiter_service.LOCAL_SYNC_INTERVAL
+    await limiter.check_limit("1.2.3.4", "lead_creation")
+    assert redis.attempts == 2
+    window = limiter._local["rate_limit:lead_creation:1.2.3.4"]
+    assert window.unsynced == LOCAL_SYNC_EVERY * 2 + 1
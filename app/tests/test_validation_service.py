@@ -1,79 +1,72 @@
 """Tests for validation service."""
 import pytest
-from src.services.validation_service import ValidationService
 
 
-def test_validate_phone_number_valid():
+def test_validate_phone_number_valid(validation_service):
     """Test validating valid phone numbers."""
-    service = ValidationService()
-    
     # Test international format
-    result = service.validate_phone_number("+1234567890")
+    result = validation_service.validate_phone_number("+1234567890")
     assert result.is_valid is True
     assert result.normalized == "+1234567890"
     
     # Test with spaces/dashes
-    result = service.validate_phone_number("+1 (234) 567-890")
+    result = validation_service.validate_phone_number("+1 (234) 567-890")
     assert result.is_valid is True
 
 
-def test_validate_phone_number_invalid():
+def test_validate_phone_number_invalid(validation_service):
     """Test validating invalid phone numbers."""
-    service = ValidationService()
-    
     # Too short
-    result = service.validate_phone_number("123")
+    result = validation_service.validate_phone_number("123")
     assert result.is_valid is False
     
     # Invalid format
-    result = service.validate_phone_number("abc")
+    result = validation_service.validate_phone_number("abc")
     assert result.is_valid is False
 
 
-def test_validate_nid_valid():
+def test_validate_nid_valid(validation_service):
     """Test validating valid NID."""
-    service = ValidationService()
-    
     # Default format
-    result = service.validate_nid("12345678")
+    result = validation_service.validate_nid("12345678")
     assert result.is_valid is True
     
     # US SSN format
-    result = service.validate_nid("123456789", country="US")
+    result = validation_service.validate_nid("123456789", country="US")
     assert result.is_valid is True
 
 
-def test_validate_nid_invalid():
+def test_validate_nid_invalid(validation_service):
     """Test validating invalid NID."""
-    service = ValidationService()
-    
     # Too short
-    result = service.validate_nid("123")
+    result = validation_service.validate_nid("123")
+    assert result.is_valid is False
+    
+    # Underscores only
+    result = validation_service.validate_nid("________")
     assert result.is_valid is False
 
 
-def test_validate_email_valid():
+def test_validate_email_valid(validation_service):
     """Test validating valid email."""
-    service = ValidationService()
-    
-    result = service.validate_email("test@example.com")
+    result = validation_service.validate_email("test@example.com")
     assert result.is_valid is True
     assert result.normalized == "test@example.com"
 
 
-def test_validate_email_invalid():
+def test_validate_email_invalid(validation_service):
     """Test validating invalid email."""
-    service = ValidationService()
+    result = validation_service.validate_email("invalid-email")
+    assert result.is_valid is False
     
-    result = service.validate_email("invalid-email")
+    # "|" is not a valid top-level domain character
+    result = validation_service.validate_email("test@example.c|m")
     assert result.is_valid is False
 
 
-def test_validate_lead_data_complete():
+def test_validate_lead_data_complete(validation_service):
     """Test validating complete lead data."""
-    service = ValidationService()
-    
-    result = service.validate_lead_data(
+    result = validation_service.validate_lead_data(
         name="John Doe",
         phone="+1234567890",
         nid="123456789",
@@ -84,11 +77,9 @@ def test_validate_lead_data_complete():
     assert result.is_valid is True
 
 
-def test_validate_lead_data_incomplete():
+def test_validate_lead_data_incomplete(validation_service):
     """Test validating incomplete lead data."""
-    service = ValidationService()
-    
-    result = service.validate_lead_data(
+    result = validation_service.validate_lead_data(
         name="J",  # Too short
         phone="123",  # Invalid
         address="123"  # Too short
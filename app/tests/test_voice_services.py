@@ -1,4 +1,6 @@
 """Tests for voice services."""
+import asyncio
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from pathlib import Path
@@ -6,6 +8,8 @@ from pathlib import Path
 from src.services.voice import STTService, TTSService
 from src.services.voice.stt_service import OpenAISTTProvider
 from src.services.voice.tts_service import OpenAITTSProvider
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.retry_service import RetryService, RetryConfig
 
 
 @pytest.mark.asyncio
@@ -38,6 +42,91 @@ async def test_tts_synthesize():
     mock_provider.synthesize.assert_called_once_with(text, "en", "alloy")
 
 
+@pytest.mark.asyncio
+async def test_tts_synthesize_uses_cache():
+    """Test repeated TTS requests are served from the cache."""
+    mock_provider = AsyncMock(spec=OpenAITTSProvider)
+    mock_provider.synthesize = AsyncMock(return_value=b"fake_audio_bytes")
+    
+    service = TTSService(provider=mock_provider)
+    
+    first = await service.synthesize_speech("Welcome!", language="en", voice="alloy")
+    second = await service.synthesize_speech("Welcome!", language="en", voice="alloy")
+    
+    assert first == second == b"fake_audio_bytes"
+    mock_provider.synthesize.assert_called_once_with("Welcome!", "en", "alloy")
+    assert service.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_stt_circuit_opens_after_repeated_failures():
+    """Test STT stops calling a failing provider once the circuit opens."""
+    mock_provider = AsyncMock(spec=OpenAISTTProvider)
+    mock_provider.transcribe = AsyncMock(side_effect=RuntimeError("provider down"))
+    
+    service = STTService(provider=mock_provider)
+    service.retry_service = RetryService(RetryConfig(max_attempts=1))
+    
+    for _ in range(service.breaker.failure_threshold):
+        with pytest.raises(RuntimeError):
+            await service.transcribe_audio(b"fake_audio_data")
+    
+    with pytest.raises(CircuitOpenError):
+        await service.transcribe_audio(b"fake_audio_data")
+    assert mock_provider.transcribe.await_count == service.breaker.failure_threshold
+
+
+@pytest.mark.asyncio
+async def test_stt_circuit_ignores_client_errors():
+    """Test 4xx responses and validation errors do not open the circuit."""
+    request = httpx.Request("POST", "https://provider.test/transcribe")
+    response = httpx.Response(400, request=request)
+    
+    async def bad_request(audio_data, language):
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            raise Exception(f"Provider error: {e}")
+    
+    mock_provider = AsyncMock(spec=OpenAISTTProvider)
+    mock_provider.transcribe = AsyncMock(side_effect=bad_request)
+    
+    service = STTService(provider=mock_provider)
+    service.retry_service = RetryService(RetryConfig(max_attempts=1))
+    
+    for _ in range(service.breaker.failure_threshold + 1):
+        with pytest.raises(Exception, match="Provider error"):
+            await service.transcribe_audio(b"fake_audio_data")
+    
+    mock_provider.transcribe.side_effect = ValueError("unsupported audio format")
+    with pytest.raises(ValueError):
+        await service.transcribe_audio(b"fake_audio_data")
+    assert service.breaker.failures == 0
+    assert not service.breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_half_open_allows_one_trial():
+    """Test only one trial call reaches the provider after the reset timeout."""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    
+    release = asyncio.Event()
+    
+    async def trial():
+        await release.wait()
+        return "ok"
+    
+    trial_task = asyncio.ensure_future(breaker.call(trial))
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(AsyncMock(return_value="rejected"))
+    
+    release.set()
+    assert await trial_task == "ok"
+    assert await breaker.call(AsyncMock(return_value="closed")) == "closed"
+
+
 @pytest.mark.asyncio
 async def test_stt_transcribe_file():
     """Test STT transcription from file."""
@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from config.cache import redis_manager
 from config.database import init_db
 from config.settings import settings
+from .responses import ORJSONResponse
 from .router import api_router
 from tools import register_default_tools
 
@@ -36,6 +37,7 @@ def create_api_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
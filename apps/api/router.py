@@ -2,29 +2,116 @@
 
 from __future__ import annotations
 
+import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter, ValidationError
+from redis.exceptions import RedisError
 
+from config.cache import redis_manager
 from graph.build_graph import build_conversation_graph
 from state.schemas import ConversationState, Message, MessageType
+from .responses import ORJSONResponse
 
-api_router = APIRouter(prefix="/api", tags=["conversation"])
+logger = logging.getLogger(__name__)
 
+api_router = APIRouter(prefix="/api", tags=["conversation"])
 
-class ConversationStore:
-    """In-memory store for demo purposes."""
+CONVERSATION_CACHE_SIZE = 10_000
+CONVERSATION_TTL_SECONDS = 3600
 
-    def __init__(self) -> None:
-        self._store: dict[str, ConversationState] = {}
+# Matches ConversationState.metadata, which update() would not validate
+_METADATA_ADAPTER = TypeAdapter(dict[str, str])
 
-    def get(self, conversation_id: str) -> ConversationState:
-        if conversation_id not in self._store:
-            self._store[conversation_id] = ConversationState()
-        return self._store[conversation_id]
 
-    def set(self, conversation_id: str, state: ConversationState) -> None:
+class ConversationStore:
+    """Bounded in-process LRU of conversation state, written through to Redis when connected."""
+
+    key_prefix = "conv:"
+
+    def __init__(
+        self,
+        maxsize: int = CONVERSATION_CACHE_SIZE,
+        ttl_seconds: int = CONVERSATION_TTL_SECONDS,
+    ) -> None:
+        self._store: OrderedDict[str, ConversationState] = OrderedDict()
+        # Per conversation: id(message) -> (message, model_dump()) from the last response
+        self._message_dumps: dict[str, dict[int, tuple[Message, dict]]] = {}
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, conversation_id: str) -> ConversationState:
+        state = self._store.get(conversation_id)
+        if state is not None:
+            self._store.move_to_end(conversation_id)
+            return state
+        state = await self._load(conversation_id) or ConversationState()
+        self._remember(conversation_id, state)
+        return state
+
+    async def set(self, conversation_id: str, state: ConversationState) -> None:
+        self._remember(conversation_id, state)
+        client = redis_manager.client
+        if client is None:
+            return
+        try:
+            await client.set(
+                self.key_prefix + conversation_id,
+                state.model_dump_json(),
+                ex=self._ttl_seconds,
+            )
+        except RedisError:
+            logger.warning("Failed to persist conversation %s to Redis", conversation_id)
+
+    def dump_messages(self, conversation_id: str, messages: list[Message]) -> list[dict]:
+        """
+        Serialize messages, reusing dumps of messages already returned for this conversation.
+
+        Messages are treated as immutable once they have been returned to a client.
+        """
+        previous = self._message_dumps.get(conversation_id, {})
+        current: dict[int, tuple[Message, dict]] = {}
+        dumps = []
+        for message in messages:
+            entry = previous.get(id(message))
+            if entry is None or entry[0] is not message:
+                entry = (message, message.model_dump())
+            current[id(message)] = entry
+            dumps.append(entry[1])
+        self._message_dumps[conversation_id] = current
+        return dumps
+
+    async def _load(self, conversation_id: str) -> ConversationState | None:
+        client = redis_manager.client
+        if client is None:
+            return None
+        try:
+            payload = await client.get(self.key_prefix + conversation_id)
+        except RedisError:
+            logger.warning("Failed to load conversation %s from Redis", conversation_id)
+            return None
+        if payload is None:
+            return None
+        try:
+            return ConversationState.model_validate_json(payload)
+        except ValidationError:
+            # Written by an older schema or holding bad data: start over rather
+            # than failing every request until the key expires
+            logger.warning("Discarding invalid stored state for conversation %s", conversation_id)
+            try:
+                await client.delete(self.key_prefix + conversation_id)
+            except RedisError:
+                logger.warning("Failed to delete conversation %s from Redis", conversation_id)
+            return None
+
+    def _remember(self, conversation_id: str, state: ConversationState) -> None:
         self._store[conversation_id] = state
+        self._store.move_to_end(conversation_id)
+        while len(self._store) > self._maxsize:
+            evicted_id, _ = self._store.popitem(last=False)
+            self._message_dumps.pop(evicted_id, None)
 
 
 conversation_store = ConversationStore()
@@ -32,13 +119,17 @@ conversation_graph = build_conversation_graph()
 
 
 @api_router.post("/conversations/{conversation_id}/messages")
-async def post_message(conversation_id: str, payload: dict) -> dict:
+async def post_message(conversation_id: str, payload: dict) -> ORJSONResponse:
     """Accept a user message and return the updated conversation state."""
     content = payload.get("content")
     if not content:
         raise HTTPException(status_code=422, detail="content is required")
+    try:
+        metadata = _METADATA_ADAPTER.validate_python(payload.get("metadata") or {})
+    except ValidationError:
+        raise HTTPException(status_code=422, detail="metadata must map strings to strings")
 
-    state = conversation_store.get(conversation_id)
+    state = await conversation_store.get(conversation_id)
     state.messages.append(
         Message(
             role="user",
@@ -49,28 +140,32 @@ async def post_message(conversation_id: str, payload: dict) -> dict:
     )
 
     state.current_objective = payload.get("objective") or state.current_objective
-    state.metadata.update(payload.get("metadata") or {})
+    state.metadata.update(metadata)
 
     updated_state = conversation_graph.run_turn(state)
-    conversation_store.set(conversation_id, updated_state)
-
-    return {
-        "conversation_id": conversation_id,
-        "messages": [message.model_dump() for message in updated_state.messages],
-        "plan_steps": updated_state.plan_steps,
-        "retrieved_context": [doc.model_dump() for doc in updated_state.retrieved_context],
-        "metadata": updated_state.metadata,
-    }
+    await conversation_store.set(conversation_id, updated_state)
+
+    # Returned as a response directly so FastAPI skips jsonable_encoder on the payload
+    return ORJSONResponse(
+        {
+            "conversation_id": conversation_id,
+            "messages": conversation_store.dump_messages(conversation_id, updated_state.messages),
+            "plan_steps": updated_state.plan_steps,
+            "retrieved_context": [doc.model_dump() for doc in updated_state.retrieved_context],
+            "metadata": updated_state.metadata,
+        }
+    )
 
 
 @api_router.get("/conversations/{conversation_id}")
-async def get_conversation(conversation_id: str) -> dict:
-    state = conversation_store.get(conversation_id)
-    return {
-        "conversation_id": conversation_id,
-        "messages": [message.model_dump() for message in state.messages],
-        "plan_steps": state.plan_steps,
-        "long_term_notes": state.long_term_notes,
-        "metadata": state.metadata,
-    }
-
+async def get_conversation(conversation_id: str) -> ORJSONResponse:
+    state = await conversation_store.get(conversation_id)
+    return ORJSONResponse(
+        {
+            "conversation_id": conversation_id,
+            "messages": conversation_store.dump_messages(conversation_id, state.messages),
+            "plan_steps": state.plan_steps,
+            "long_term_notes": state.long_term_notes,
+            "metadata": state.metadata,
+        }
+    )
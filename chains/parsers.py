@@ -2,41 +2,66 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from state.schemas import PlanDecision, RetrievedDocument
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _construct_or_validate(cls: Type[ModelT], payload: Dict[str, Any], trusted: bool) -> ModelT:
+    """Build ``cls`` from ``payload``, skipping validation for trusted producers.
+
+    Trusted payloads come from our own heuristic chains, so their shape is
+    already known to be correct. Nested models must be built by the caller
+    because ``model_construct`` does not coerce field values.
+    """
+    if trusted:
+        return cls.model_construct(**payload)
+    return cls.model_validate(payload)
+
 
 class PlannerOutput(BaseModel):
     """Structured output from the planner chain."""
 
+    model_config = ConfigDict(frozen=True)
+
     decision: PlanDecision
     rationale: str = Field(..., min_length=1)
     plan_steps: List[str] = Field(default_factory=list)
     pending_tool: Optional[str] = None
 
 
+_JSON_TYPES = (str, bytes, bytearray)
+
+
 def _coerce_payload(data: Any) -> Dict[str, Any]:
     if isinstance(data, dict):
         return data
-    if isinstance(data, str):
-        try:
-            return json.loads(data)
-        except json.JSONDecodeError as exc:
-            raise ValueError("Planner output string is not valid JSON.") from exc
     if isinstance(data, PlannerOutput):
         return data.model_dump()
     raise ValueError(f"Unsupported planner output type: {type(data)!r}")
 
 
-def parse_planner_output(data: Any) -> PlannerOutput:
-    """Parse raw planner output into a structured object."""
+def parse_planner_output(data: Any, trusted: bool = False) -> PlannerOutput:
+    """Parse raw planner output into a structured object.
+
+    Pass ``trusted=True`` only for dicts produced by the built-in planner chain.
+    """
+    if isinstance(data, _JSON_TYPES):
+        try:
+            return PlannerOutput.model_validate_json(data)
+        except ValidationError as exc:
+            raise ValueError("Planner output is not valid JSON with the required fields.") from exc
     payload = _coerce_payload(data)
+    trusted = trusted and isinstance(data, dict)
+    if trusted:
+        # model_construct skips coercion, so convert the decision string here
+        payload = {**payload, "decision": PlanDecision(payload["decision"])}
     try:
-        return PlannerOutput(**payload)
+        return _construct_or_validate(PlannerOutput, payload, trusted)
     except ValidationError as exc:
         raise ValueError("Planner output is missing required fields.") from exc
 
@@ -49,27 +74,40 @@ def parse_action_output(data: Any) -> Any:
 class RetrieverOutput(BaseModel):
     """Structured output from retriever chain."""
 
+    model_config = ConfigDict(frozen=True)
+
     results: List[RetrievedDocument] = Field(default_factory=list)
 
 
-def parse_retriever_output(data: Any) -> RetrieverOutput:
-    """Parse raw retriever output into structured form."""
+_RESULTS_ADAPTER = TypeAdapter(List[RetrievedDocument])
+
+
+def parse_retriever_output(data: Any, trusted: bool = False) -> RetrieverOutput:
+    """Parse raw retriever output into structured form.
+
+    Pass ``trusted=True`` only for dicts produced by the built-in retriever chain.
+    """
     if isinstance(data, RetrieverOutput):
         return data
     if isinstance(data, list):
-        payload = {"results": data}
+        results = data
     elif isinstance(data, dict):
-        payload = data
-    elif isinstance(data, str):
+        results = data.get("results", [])
+    elif isinstance(data, _JSON_TYPES):
         try:
-            payload = json.loads(data)
-        except json.JSONDecodeError as exc:
-            raise ValueError("Retriever output string is not valid JSON.") from exc
+            return RetrieverOutput.model_validate_json(data)
+        except ValidationError as exc:
+            raise ValueError("Retriever output is not valid JSON with the required fields.") from exc
     else:
         raise ValueError(f"Unsupported retriever output type: {type(data)!r}")
 
+    if trusted and isinstance(data, dict):
+        return RetrieverOutput.model_construct(
+            results=[RetrievedDocument.model_construct(**doc) for doc in results]
+        )
+    # Only the results list needs validating; the wrapper has no other fields
     try:
-        return RetrieverOutput(**payload)
+        return RetrieverOutput.model_construct(results=_RESULTS_ADAPTER.validate_python(results))
     except ValidationError as exc:
         raise ValueError("Retriever output is missing required fields.") from exc
 
@@ -77,6 +115,8 @@ def parse_retriever_output(data: Any) -> RetrieverOutput:
 class ActionToolCall(BaseModel):
     """Structured representation of a tool invocation."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     arguments: Dict[str, Any] = Field(default_factory=dict)
 
@@ -84,30 +124,36 @@ class ActionToolCall(BaseModel):
 class ActionOutput(BaseModel):
     """Structured response from the action chain."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: Optional[str] = None
     tool_call: Optional[ActionToolCall] = None
     confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
 
 
-def parse_action_output(data: Any) -> ActionOutput:
-    """Parse raw action output into structured form."""
+def parse_action_output(data: Any, trusted: bool = False) -> ActionOutput:
+    """Parse raw action output into structured form.
+
+    Pass ``trusted=True`` only for dicts produced by the built-in action chain.
+    """
     if isinstance(data, ActionOutput):
         return data
-    if isinstance(data, dict):
+    if isinstance(data, _JSON_TYPES):
+        try:
+            result = ActionOutput.model_validate_json(data)
+        except ValidationError as exc:
+            raise ValueError("Action output is not valid JSON with the required fields.") from exc
+    elif isinstance(data, dict):
         payload = data
-    elif isinstance(data, str):
+        if trusted and isinstance(payload.get("tool_call"), dict):
+            payload = {**payload, "tool_call": ActionToolCall.model_construct(**payload["tool_call"])}
         try:
-            payload = json.loads(data)
-        except json.JSONDecodeError as exc:
-            raise ValueError("Action output string is not valid JSON.") from exc
+            result = _construct_or_validate(ActionOutput, payload, trusted)
+        except ValidationError as exc:
+            raise ValueError("Action output is missing required fields.") from exc
     else:
         raise ValueError(f"Unsupported action output type: {type(data)!r}")
 
-    try:
-        result = ActionOutput(**payload)
-    except ValidationError as exc:
-        raise ValueError("Action output is missing required fields.") from exc
-
     if not result.message and not result.tool_call:
         raise ValueError("Action output must include a message or a tool_call.")
     return result
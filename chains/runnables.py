@@ -2,9 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Protocol
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Union
 
 from rag.retriever import get_retriever
+from state.schemas import Message, RetrievedDocument
+
+# Substring match (not whole words) so "rates" or "premiums" also trigger retrieval
+_INTENT_RE = re.compile(r"policy|rate|premium", re.IGNORECASE)
+_USER = sys.intern("user")
+_DECISION_RATIONALES = {
+    "retrieve": "Need supporting knowledge before responding.",
+    "end": "Conversation marked as complete.",
+    "continue": "Provide a direct response.",
+}
+
+
+def _latest_user_content(inputs: Dict[str, Any]) -> str:
+    if "latest_user_content" in inputs:
+        return inputs["latest_user_content"] or ""
+    for message in reversed(inputs.get("history") or []):
+        # == rather than is: histories from other callers may hold non-interned strings
+        if message.get("message_type") == _USER:
+            return message.get("content", "")
+    return ""
+
+
+class _ChainInputs:
+    """Dict conversion shared by the node-to-chain input records."""
+
+    __slots__ = ()
+
+    def as_dict(self, messages: Optional[Sequence[Message]] = None) -> Dict[str, Any]:
+        """Return the inputs in the dict form expected by injected chains.
+
+        Injected chains receive plain dicts: ``retrieved_context`` holds
+        document dumps and ``history`` holds ``model_dump()`` of each of
+        ``messages`` (the state's full history). Without ``messages``,
+        ``history`` is a copy of the reduced view entries.
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if "history" in data:
+            if messages is not None:
+                data["history"] = [message.model_dump() for message in messages]
+            else:
+                data["history"] = [dict(entry) for entry in data["history"]]
+        if "retrieved_context" in data:
+            data["retrieved_context"] = [doc.model_dump() for doc in data["retrieved_context"]]
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class PlannerInputs(_ChainInputs):
+    """Inputs passed from the planner node to the built-in planner chain."""
+
+    objective: Optional[str] = None
+    history: List[Dict[str, str]] = field(default_factory=list)
+    latest_user_content: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, inputs: Dict[str, Any]) -> "PlannerInputs":
+        return cls(
+            objective=inputs.get("objective") or inputs.get("current_objective"),
+            history=inputs.get("history") or [],
+            latest_user_content=_latest_user_content(inputs),
+            metadata=inputs.get("metadata") or {},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RetrieverInputs(_ChainInputs):
+    """Inputs passed from the retriever node to the built-in retriever chain."""
+
+    query: str = ""
+    plan_steps: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    top_k: int = 3
+
+    @classmethod
+    def from_dict(cls, inputs: Dict[str, Any]) -> "RetrieverInputs":
+        return cls(
+            query=inputs.get("query") or "",
+            plan_steps=inputs.get("plan_steps") or [],
+            metadata=inputs.get("metadata") or {},
+            top_k=inputs.get("top_k", 3),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ActionInputs(_ChainInputs):
+    """Inputs passed from the action node to the built-in action chain."""
+
+    plan_steps: List[str] = field(default_factory=list)
+    planner_rationale: Optional[str] = None
+    retrieved_context: List[RetrievedDocument] = field(default_factory=list)
+    current_objective: Optional[str] = None
+    history: List[Dict[str, str]] = field(default_factory=list)
+    latest_user_content: str = ""
+    pending_tool_call: Optional[str] = None
+    tool_arguments: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, inputs: Dict[str, Any]) -> "ActionInputs":
+        return cls(
+            plan_steps=inputs.get("plan_steps") or [],
+            planner_rationale=inputs.get("planner_rationale"),
+            retrieved_context=inputs.get("retrieved_context") or [],
+            current_objective=inputs.get("current_objective"),
+            history=inputs.get("history") or [],
+            latest_user_content=_latest_user_content(inputs),
+            pending_tool_call=inputs.get("pending_tool_call"),
+            tool_arguments=inputs.get("tool_arguments") or {},
+        )
 
 
 class PlannerChain(Protocol):
@@ -17,16 +130,12 @@ class PlannerChain(Protocol):
 class _NotImplementedPlannerChain:
     """Default planner chain that applies heuristic planning rules."""
 
-    def __call__(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        history: List[Dict[str, Any]] = inputs.get("history", [])
-        objective: Optional[str] = inputs.get("objective") or inputs.get("current_objective")
-        metadata: Dict[str, Any] = inputs.get("metadata") or {}
-
-        latest_user = ""
-        for message in reversed(history):
-            if message.get("message_type") == "user":
-                latest_user = message.get("content", "")
-                break
+    def __call__(self, inputs: Union[PlannerInputs, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(inputs, dict):
+            inputs = PlannerInputs.from_dict(inputs)
+        objective = inputs.objective
+        metadata = inputs.metadata
+        latest_user = inputs.latest_user_content
 
         plan_steps: List[str] = []
         if objective:
@@ -36,12 +145,11 @@ class _NotImplementedPlannerChain:
 
         decision = "continue"
         pending_tool = None
-        lowered = latest_user.lower()
 
         if metadata.get("requires_tool"):
             decision = "tool"
             pending_tool = metadata["requires_tool"]
-        elif "policy" in lowered or "rate" in lowered or "premium" in lowered:
+        elif _INTENT_RE.search(latest_user):
             decision = "retrieve"
         elif metadata.get("conversation_status") == "completed":
             decision = "end"
@@ -49,14 +157,10 @@ class _NotImplementedPlannerChain:
         rationale_parts = []
         if latest_user:
             rationale_parts.append(f"Customer asked about: '{latest_user[:60]}'")
-        if decision == "retrieve":
-            rationale_parts.append("Need supporting knowledge before responding.")
-        elif decision == "tool":
+        if decision == "tool":
             rationale_parts.append(f"Trigger tool: {pending_tool}.")
-        elif decision == "end":
-            rationale_parts.append("Conversation marked as complete.")
         else:
-            rationale_parts.append("Provide a direct response.")
+            rationale_parts.append(_DECISION_RATIONALES[decision])
 
         return {
             "decision": decision,
@@ -66,6 +170,7 @@ class _NotImplementedPlannerChain:
         }
 
 
+@lru_cache(maxsize=1)
 def build_planner_chain() -> PlannerChain:
     """Return the planner runnable."""
     return _NotImplementedPlannerChain()
@@ -79,16 +184,23 @@ class RetrieverChain(Protocol):
 
 
 class _SimpleRetrieverChain:
-    """Retriever chain that delegates to the in-memory retriever."""
+    """Retriever chain that delegates to the in-memory retriever.
+
+    get_retriever() is called per invocation because it is cached until the
+    document store is re-ingested, which a retriever held here would miss.
+    """
 
-    def __call__(self, inputs: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:  # pragma: no cover - thin wrapper
+    def __call__(
+        self, inputs: Union[RetrieverInputs, Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:  # pragma: no cover - thin wrapper
+        if isinstance(inputs, dict):
+            inputs = RetrieverInputs.from_dict(inputs)
         retriever = get_retriever()
-        query = inputs.get("query") or ""
-        top_k = inputs.get("top_k", 3)
-        results = retriever(query, top_k=top_k)
+        results = retriever(inputs.query, top_k=inputs.top_k)
         return {"results": results}
 
 
+@lru_cache(maxsize=1)
 def build_retriever_chain() -> RetrieverChain:
     """Return the retriever runnable."""
     return _SimpleRetrieverChain()
@@ -104,24 +216,19 @@ class ActionChain(Protocol):
 class _HeuristicActionChain:
     """Simple action chain that crafts responses based on retrieved context."""
 
-    def __call__(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        pending_tool = inputs.get("pending_tool_call")
+    def __call__(self, inputs: Union[ActionInputs, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(inputs, dict):
+            inputs = ActionInputs.from_dict(inputs)
+        pending_tool = inputs.pending_tool_call
         if pending_tool:
-            return {"message": None, "tool_call": {"name": pending_tool, "arguments": inputs.get("tool_arguments", {})}, "confidence": 0.6}
-
-        retrieved_context: List[Dict[str, Any]] = inputs.get("retrieved_context") or []
-        plan_steps: List[str] = inputs.get("plan_steps") or []
-        history: List[Dict[str, Any]] = inputs.get("history") or []
+            return {"message": None, "tool_call": {"name": pending_tool, "arguments": inputs.tool_arguments}, "confidence": 0.6}
 
-        latest_user = ""
-        for message in reversed(history):
-            if message.get("message_type") == "user":
-                latest_user = message.get("content", "")
-                break
+        retrieved_context = inputs.retrieved_context
+        plan_steps = inputs.plan_steps
+        latest_user = inputs.latest_user_content
 
         if retrieved_context:
-            snippet = retrieved_context[0]["content"]
-            message = f"Based on our policies: {snippet}"
+            message = f"Based on our policies: {retrieved_context[0].content}"
         elif plan_steps:
             message = f"Let's proceed: {plan_steps[0]}"
         elif latest_user:
@@ -132,6 +239,7 @@ class _HeuristicActionChain:
         return {"message": message, "tool_call": None, "confidence": 0.75}
 
 
+@lru_cache(maxsize=1)
 def build_action_chain() -> ActionChain:
     """Return the action runnable."""
     return _HeuristicActionChain()
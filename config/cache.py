@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import AsyncGenerator, Optional
-
-from redis.asyncio import Redis
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from config.settings import settings
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
 
 class RedisManager:
     """Lazy-initialised Redis client singleton."""
@@ -17,12 +18,25 @@ class RedisManager:
 
     async def connect(self) -> Redis:
         if self._client is None:
-            self._client = Redis.from_url(
+            from redis.asyncio import BlockingConnectionPool, Redis
+
+            # Blocking pool: callers wait for a free connection instead of
+            # failing once redis_pool_size connections are in use.
+            pool = BlockingConnectionPool.from_url(
                 settings.redis_url,
                 password=settings.redis_password,
                 encoding="utf-8",
                 decode_responses=True,
+                max_connections=settings.redis_pool_size,
+                health_check_interval=30,
+                socket_keepalive=True,
             )
+            self._client = Redis(connection_pool=pool)
+        return self._client
+
+    @property
+    def client(self) -> Optional[Redis]:
+        """The connected client, or None if connect() has not been called."""
         return self._client
 
     async def ping(self) -> bool:
@@ -34,7 +48,7 @@ class RedisManager:
 
     async def disconnect(self) -> None:
         if self._client is not None:
-            await self._client.close()
+            await self._client.aclose(close_connection_pool=True)
             self._client = None
 
 
@@ -42,9 +56,5 @@ redis_manager = RedisManager()
 
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
-    client = await redis_manager.connect()
-    try:
-        yield client
-    finally:
-        pass
+    yield await redis_manager.connect()
 
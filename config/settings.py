@@ -19,6 +19,7 @@ class Settings(BaseSettings):
         env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Application
@@ -37,6 +38,7 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
     redis_password: Optional[str] = None
+    redis_pool_size: int = 32
     session_ttl: int = 3600
 
     # LLM Configuration
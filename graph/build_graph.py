@@ -6,39 +6,76 @@ from dataclasses import dataclass
 from typing import Optional
 
 from graph.nodes import action, decider, planner, reflector, retriever
+from state.cache import state_key
+from state.checkpoints import CheckpointStore
 from state.memory import apply_long_term_memory, apply_short_term_memory
 from state.schemas import ConversationState
 
 
 @dataclass
 class ConversationGraph:
-    """Lightweight conversation graph used until LangGraph integration."""
+    """Lightweight conversation graph used until LangGraph integration.
+
+    With ``checkpoints`` (or ``turn_cache_size``) set, the result of a turn is
+    memoized by the canonical key of the incoming state, so replaying an
+    identical state skips the chains. Only enable it when the chains are
+    deterministic.
+    """
 
     planner_chain: Optional[object] = None
     retriever_chain: Optional[object] = None
     action_chain: Optional[object] = None
     enable_reflection: bool = False
+    turn_cache_size: int = 0
+    checkpoints: Optional[CheckpointStore] = None
+
+    def __post_init__(self) -> None:
+        if self.checkpoints is None and self.turn_cache_size:
+            self.checkpoints = CheckpointStore(maxsize=self.turn_cache_size)
 
     def run_turn(self, state: Optional[ConversationState] = None) -> ConversationState:
         state = state or ConversationState()
+        if self.checkpoints is None:
+            return self._run_turn(state)
+
+        key = state_key(state)
+        if key is None:
+            # Not serializable (e.g. non-JSON metadata), so it cannot be cached
+            return self._run_turn(state)
 
-        planner.plan_next_step(state, chain=self.planner_chain)
-        next_step = decider.decide_next_action(state)
+        cached = self.checkpoints.resume(key)
+        if cached is not None:
+            # Update in place, as an uncached turn would
+            for name, value in cached:
+                setattr(state, name, value)
+            return state
 
-        if next_step == "retriever":
-            retriever.retrieve_context(state, chain=self.retriever_chain)
+        self._run_turn(state)
+        self.checkpoints.snapshot(key, state)
+        return state
+
+    def _run_turn(self, state: ConversationState) -> ConversationState:
+        state.start_turn()
+        try:
+            planner.plan_next_step(state, chain=self.planner_chain)
             next_step = decider.decide_next_action(state)
 
-        if next_step == "action":
-            action.execute_action(state, chain=self.action_chain)
-        elif next_step == "end":
-            state.metadata["conversation_status"] = "completed"
+            if next_step == "retriever":
+                retriever.retrieve_context(state, chain=self.retriever_chain)
+                next_step = decider.decide_next_action(state)
+
+            if next_step == "action":
+                action.execute_action(state, chain=self.action_chain)
+            elif next_step == "end":
+                state.metadata["conversation_status"] = "completed"
 
-        if self.enable_reflection:
-            reflector.reflect_on_conversation(state)
+            if self.enable_reflection:
+                reflector.reflect_on_conversation(state)
 
-        apply_short_term_memory(state)
-        apply_long_term_memory(state)
+            apply_short_term_memory(state)
+            apply_long_term_memory(state)
+        finally:
+            state.end_turn()
         return state
 
 
@@ -48,6 +85,8 @@ def build_conversation_graph(
     retriever_chain: Optional[object] = None,
     action_chain: Optional[object] = None,
     enable_reflection: bool = False,
+    turn_cache_size: int = 0,
+    checkpoints: Optional[CheckpointStore] = None,
 ) -> ConversationGraph:
     """Construct and return the conversation graph wrapper."""
     return ConversationGraph(
@@ -55,5 +94,7 @@ def build_conversation_graph(
         retriever_chain=retriever_chain,
         action_chain=action_chain,
         enable_reflection=enable_reflection,
+        turn_cache_size=turn_cache_size,
+        checkpoints=checkpoints,
     )
 
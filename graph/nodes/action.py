@@ -2,39 +2,41 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import List, Optional
 
 from chains.parsers import ActionOutput, parse_action_output
-from chains.runnables import ActionChain, build_action_chain
+from chains.runnables import ActionChain, ActionInputs, build_action_chain
 from state.schemas import ConversationState, Message, MessageType
 from tools.mcp_client import execute_tool
 
 
-def _build_action_inputs(state: ConversationState) -> Dict[str, Any]:
-    return {
-        "plan_steps": state.plan_steps,
-        "planner_rationale": state.planner_rationale,
-        "retrieved_context": [doc.model_dump() for doc in state.retrieved_context],
-        "current_objective": state.current_objective,
-        "history": [message.model_dump() for message in state.messages],
-        "pending_tool_call": state.pending_tool_call,
-    }
+def _build_action_inputs(state: ConversationState) -> ActionInputs:
+    return ActionInputs(
+        plan_steps=state.plan_steps,
+        planner_rationale=state.planner_rationale,
+        retrieved_context=list(state.retrieved_context),
+        current_objective=state.current_objective,
+        history=state.history_view(),
+        latest_user_content=state.last_user_message() or "",
+        pending_tool_call=state.pending_tool_call,
+    )
 
 
-def _append_assistant_message(state: ConversationState, action_output: ActionOutput) -> None:
-    if action_output.message:
-        state.messages.append(
-            Message(
-                role="assistant",
-                content=action_output.message,
-                timestamp=datetime.now(timezone.utc),
-                message_type=MessageType.ASSISTANT,
-                metadata={
-                    "confidence": str(action_output.confidence or ""),
-                },
-            )
+def _assistant_messages(action_output: ActionOutput, now: datetime) -> List[Message]:
+    if not action_output.message:
+        return []
+    return [
+        Message.internal(
+            role="assistant",
+            content=action_output.message,
+            message_type=MessageType.ASSISTANT,
+            timestamp=now,
+            metadata={
+                "confidence": str(action_output.confidence or ""),
+            },
         )
+    ]
 
 
 def execute_action(
@@ -42,11 +44,16 @@ def execute_action(
     chain: Optional[ActionChain] = None,
 ) -> ConversationState:
     """Run the action chain to generate assistant response or tool call."""
-    action_chain = chain or build_action_chain()
-    raw_output = action_chain(_build_action_inputs(state))
-    action_output = parse_action_output(raw_output)
+    inputs = _build_action_inputs(state)
+    if chain is None:
+        raw_output = build_action_chain()(inputs)
+    else:
+        # Injected chains keep the dict contract of ActionChain
+        raw_output = chain(inputs.as_dict(state.messages))
+    action_output = parse_action_output(raw_output, trusted=chain is None)
 
-    _append_assistant_message(state, action_output)
+    now = state.turn_timestamp()
+    new_messages = _assistant_messages(action_output, now)
 
     if action_output.tool_call:
         tool_name = action_output.tool_call.name
@@ -54,22 +61,22 @@ def execute_action(
         try:
             result = execute_tool(tool_name, arguments)
         except Exception as exc:  # pragma: no cover - defensive
-            state.messages.append(
-                Message(
+            new_messages.append(
+                Message.internal(
                     role="system",
                     content=f"Tool '{tool_name}' failed: {exc}",
-                    timestamp=datetime.now(timezone.utc),
                     message_type=MessageType.SYSTEM,
+                    timestamp=now,
                 )
             )
             state.metadata["tool_error"] = str(exc)
         else:
-            state.messages.append(
-                Message(
+            new_messages.append(
+                Message.internal(
                     role="tool",
                     content=str(result),
-                    timestamp=datetime.now(timezone.utc),
                     message_type=MessageType.TOOL,
+                    timestamp=now,
                     metadata={"tool": tool_name},
                 )
             )
@@ -81,5 +88,5 @@ def execute_action(
         state.pending_tool_call = None
         state.metadata.pop("tool_arguments", None)
 
+    state.messages.extend(new_messages)
     return state
-
@@ -4,20 +4,25 @@ from __future__ import annotations
 
 from state.schemas import ConversationState, PlanDecision
 
+_RETRIEVE = PlanDecision.RETRIEVE
+_TOOL = PlanDecision.TOOL
+_END = PlanDecision.END
+_CONTINUE = PlanDecision.CONTINUE
+
 
 def decide_next_action(state: ConversationState) -> str:
     """Return the identifier of the next node to execute."""
-    decision = state.next_action or PlanDecision.CONTINUE
+    decision = state.next_action or _CONTINUE
 
-    if decision is PlanDecision.RETRIEVE:
+    if decision is _RETRIEVE:
         if not state.retrieved_context:
             return "retriever"
         return "action"
 
-    if decision is PlanDecision.TOOL:
+    if decision is _TOOL:
         return "action"
 
-    if decision is PlanDecision.END:
+    if decision is _END:
         return "end"
 
     return "action"
@@ -2,29 +2,29 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional 
+from typing import Optional
 
 from chains.parsers import PlannerOutput, parse_planner_output
-from chains.runnables import PlannerChain, build_planner_chain
+from chains.runnables import PlannerChain, PlannerInputs, build_planner_chain
 from state.schemas import ConversationState, Message, MessageType
 
 
-def _build_planner_inputs(state: ConversationState) -> Dict[str, Any]:
-    return {
-        "objective": state.current_objective,
-        "history": [message.model_dump() for message in state.messages],
-        "metadata": state.metadata,
-    }
+def _build_planner_inputs(state: ConversationState) -> PlannerInputs:
+    return PlannerInputs(
+        objective=state.current_objective,
+        history=state.history_view(),
+        latest_user_content=state.last_user_message() or "",
+        metadata=state.metadata,
+    )
 
 
 def _append_planner_message(state: ConversationState, planner_output: PlannerOutput) -> None:
     state.messages.append(
-        Message(
+        Message.internal(
             role="system",
             content=planner_output.rationale,
-            timestamp=datetime.now(timezone.utc),
             message_type=MessageType.PLANNER,
+            timestamp=state.turn_timestamp(),
             metadata={
                 "decision": planner_output.decision.value,
             },
@@ -37,9 +37,13 @@ def plan_next_step(
     chain: Optional[PlannerChain] = None,
 ) -> ConversationState:
     """Run the planner chain and update conversation state."""
-    planner_chain = chain or build_planner_chain()
-    raw_output = planner_chain(_build_planner_inputs(state))
-    planner_output = parse_planner_output(raw_output)
+    inputs = _build_planner_inputs(state)
+    if chain is None:
+        raw_output = build_planner_chain()(inputs)
+    else:
+        # Injected chains keep the dict contract of PlannerChain
+        raw_output = chain(inputs.as_dict(state.messages))
+    planner_output = parse_planner_output(raw_output, trusted=chain is None)
 
     state.plan_steps = planner_output.plan_steps
     state.planner_rationale = planner_output.rationale
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 from state.schemas import ConversationState, Message, MessageType
 
 
@@ -14,11 +12,11 @@ def reflect_on_conversation(state: ConversationState) -> ConversationState:
 
     summary = "; ".join(state.plan_steps[:2])
     state.messages.append(
-        Message(
+        Message.internal(
             role="system",
             content=f"Reflection: next steps -> {summary}",
-            timestamp=datetime.now(timezone.utc),
             message_type=MessageType.SYSTEM,
+            timestamp=state.turn_timestamp(),
         )
     )
     return state
@@ -2,41 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from chains.parsers import RetrieverOutput, parse_retriever_output
-from chains.runnables import RetrieverChain, build_retriever_chain
+from chains.runnables import RetrieverChain, RetrieverInputs, build_retriever_chain
 from state.schemas import ConversationState, Message, MessageType, RetrievedDocument
 
 
-def _last_user_message(state: ConversationState) -> Optional[str]:
-    for message in reversed(state.messages):
-        if message.message_type is MessageType.USER:
-            return message.content
-    return None
-
-
-def _build_retriever_inputs(state: ConversationState) -> Dict[str, Any]:
-    query = _last_user_message(state) or state.current_objective or ""
-    return {
-        "query": query,
-        "plan_steps": state.plan_steps,
-        "metadata": state.metadata,
-        "top_k": 3,
-    }
+def _build_retriever_inputs(state: ConversationState) -> RetrieverInputs:
+    return RetrieverInputs(
+        query=state.last_user_message() or state.current_objective or "",
+        plan_steps=state.plan_steps,
+        metadata=state.metadata,
+        top_k=3,
+    )
 
 
 def _append_retriever_message(state: ConversationState, documents: RetrieverOutput) -> None:
-    summary = ", ".join(
-        filter(None, [doc.source for doc in documents.results])
-    ) or "No sources"
+    summary = ", ".join(doc.source for doc in documents.results if doc.source) or "No sources"
     state.messages.append(
-        Message(
+        Message.internal(
             role="system",
             content=f"Retrieved {len(documents.results)} documents: {summary}",
-            timestamp=datetime.now(timezone.utc),
             message_type=MessageType.RETRIEVER,
+            timestamp=state.turn_timestamp(),
         )
     )
 
@@ -46,9 +35,10 @@ def retrieve_context(
     chain: Optional[RetrieverChain] = None,
 ) -> ConversationState:
     """Run the retriever chain and update conversation state."""
-    retriever_chain = chain or build_retriever_chain()
-    raw_output = retriever_chain(_build_retriever_inputs(state))
-    retriever_output = parse_retriever_output(raw_output)
+    inputs = _build_retriever_inputs(state)
+    # Injected chains keep the dict contract of RetrieverChain
+    raw_output = build_retriever_chain()(inputs) if chain is None else chain(inputs.as_dict())
+    retriever_output = parse_retriever_output(raw_output, trusted=chain is None)
 
     state.retrieved_context = retriever_output.results
     _append_retriever_message(state, retriever_output)
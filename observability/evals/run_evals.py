@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
 DATASET_DIR = Path(__file__).resolve().parent / "datasets"
 
 
@@ -14,11 +15,11 @@ def _load_dataset(name: str) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     records: List[Dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in path.read_bytes().splitlines():
         line = line.strip()
         if not line:
             continue
-        records.append(json.loads(line))
+        records.append(orjson.loads(line))
     return records
 
 
@@ -7,6 +7,7 @@ from typing import Iterable, List, Tuple, Union
 from rag.schemas import DocumentMetadata
 
 _DOCUMENT_STORE: List[Tuple[str, DocumentMetadata]] = []
+_STORE_VERSION = 0
 
 
 def _coerce_metadata(metadata: Union[DocumentMetadata, dict]) -> DocumentMetadata:
@@ -19,12 +20,18 @@ def _coerce_metadata(metadata: Union[DocumentMetadata, dict]) -> DocumentMetadat
 
 def ingest_documents(documents: Iterable[Tuple[str, Union[DocumentMetadata, dict]]]) -> None:
     """Simple in-memory ingestion for development and testing."""
+    global _STORE_VERSION
     _DOCUMENT_STORE.clear()
     for content, metadata in documents:
         _DOCUMENT_STORE.append((content, _coerce_metadata(metadata)))
+    _STORE_VERSION += 1
 
 
 def get_document_store() -> List[Tuple[str, DocumentMetadata]]:
     """Return the in-memory document store."""
     return list(_DOCUMENT_STORE)
 
+
+def get_store_version() -> int:
+    """Return a counter that changes every time documents are ingested."""
+    return _STORE_VERSION
@@ -2,36 +2,48 @@
 
 from __future__ import annotations
 
-from difflib import SequenceMatcher
-from typing import Any, Dict, List
+import heapq
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
-from rag.ingest import get_document_store
+from rag.ingest import get_document_store, get_store_version
 from rag.schemas import DocumentMetadata
 
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
 
 class SimpleRetriever:
     """Lightweight retriever used during early migration."""
 
     def __init__(self, documents: List[tuple[str, DocumentMetadata]]) -> None:
         self._documents = documents
+        self._tokens = [_tokenize(content) for content, _ in documents]
 
-    def _score(self, query: str, content: str) -> float:
-        return SequenceMatcher(None, query.lower(), content.lower()).ratio()
+    def _score(self, query_tokens: frozenset[str], document_tokens: frozenset[str]) -> float:
+        """Jaccard similarity between the query and document token sets."""
+        overlap = len(query_tokens & document_tokens)
+        if not overlap:
+            return 0.0
+        return overlap / (len(query_tokens) + len(document_tokens) - overlap)
 
     def invoke(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
-        scored = []
-        for content, metadata in self._documents:
-            score = self._score(query, content)
-            scored.append((score, content, metadata))
-        scored.sort(key=lambda item: item[0], reverse=True)
+        query_tokens = _tokenize(query)
+        scores = [self._score(query_tokens, tokens) for tokens in self._tokens]
+        top = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
         results = []
-        for score, content, metadata in scored[:top_k]:
+        for index in top:
+            content, metadata = self._documents[index]
             results.append(
                 {
                     "content": content,
                     "source": metadata.source,
-                    "score": score,
-                    "metadata": metadata.model_dump(),
+                    "score": scores[index],
+                    # RetrievedDocument metadata is Dict[str, str]; unset fields are omitted
+                    "metadata": metadata.model_dump(exclude_none=True),
                 }
             )
         return results
@@ -40,10 +52,22 @@ class SimpleRetriever:
         return self.invoke(query=query, top_k=top_k)
 
 
+_RETRIEVER_CACHE: Optional[Tuple[int, SimpleRetriever]] = None
+
+
 def get_retriever() -> SimpleRetriever:
-    """Return the configured retriever (vector/hybrid)."""
+    """Return the configured retriever (vector/hybrid).
+
+    The retriever is reused until documents are ingested again.
+    """
+    global _RETRIEVER_CACHE
+    version = get_store_version()
+    if _RETRIEVER_CACHE is not None and _RETRIEVER_CACHE[0] == version:
+        return _RETRIEVER_CACHE[1]
     documents = get_document_store()
     if not documents:
         raise ValueError("Document store is empty. Call ingest_documents() first.")
-    return SimpleRetriever(documents)
+    retriever = SimpleRetriever(documents)
+    _RETRIEVER_CACHE = (version, retriever)
+    return retriever
 
@@ -0,0 +1,36 @@
+"""Canonical cache keys for conversation state."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+import orjson
+
+from state.schemas import ConversationState
+
+
+def freeze_state(state: ConversationState) -> bytes:
+    """Serialize state canonically so equal states produce identical bytes.
+
+    Only declared fields are included, and dict keys are sorted, so the result
+    does not depend on object identity or on metadata insertion order.
+    Raises orjson.JSONEncodeError if the state holds values that are not
+    JSON serializable, such as arbitrary objects placed in metadata.
+    """
+    # Fields are not validated on assignment, so metadata may hold values of
+    # other types; those are keyed as-is instead of warning on every turn
+    return orjson.dumps(state.model_dump(warnings=False), option=orjson.OPT_SORT_KEYS)
+
+
+def state_key(state: ConversationState) -> Optional[str]:
+    """Return a short stable digest of the state for use as a cache key.
+
+    Returns None when the state cannot be serialized, in which case it must
+    not be cached.
+    """
+    try:
+        frozen = freeze_state(state)
+    except orjson.JSONEncodeError:
+        return None
+    return hashlib.blake2b(frozen, digest_size=16).hexdigest()
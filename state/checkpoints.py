@@ -0,0 +1,63 @@
+"""Snapshots of conversation state for replaying identical turns."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import orjson
+
+from state.schemas import ConversationState
+
+
+class CheckpointStore:
+    """Bounded LRU of post-turn state snapshots keyed by the pre-turn state key."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._snapshots: OrderedDict[str, ConversationState] = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def snapshot(self, key: str, state: ConversationState) -> None:
+        """Store a copy of ``state`` under ``key``, evicting the oldest entry when full."""
+        self._snapshots[key] = state.model_copy(deep=True)
+        self._snapshots.move_to_end(key)
+        if len(self._snapshots) > self._maxsize:
+            self._snapshots.popitem(last=False)
+
+    def resume(self, key: str) -> Optional[ConversationState]:
+        """Return a copy of the snapshot for ``key``, or None."""
+        state = self._snapshots.get(key)
+        if state is None:
+            return None
+        self._snapshots.move_to_end(key)
+        return state.model_copy(deep=True)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write all snapshots to ``path`` atomically."""
+        path = Path(path)
+        payload = orjson.dumps({key: state.model_dump() for key, state in self._snapshots.items()})
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path], maxsize: int = 128) -> "CheckpointStore":
+        """Load snapshots written by save(); a missing file gives an empty store."""
+        store = cls(maxsize=maxsize)
+        path = Path(path)
+        if not path.exists():
+            return store
+        for key, data in orjson.loads(path.read_bytes()).items():
+            store.snapshot(key, ConversationState.model_validate(data))
+        return store
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 from state.schemas import ConversationState, MessageType
 
+_LONG_TERM_TYPES: frozenset[MessageType] = frozenset({MessageType.ASSISTANT, MessageType.SYSTEM})
+
 
 def apply_short_term_memory(state: ConversationState, max_messages: int = 20) -> ConversationState:
     """Trim conversation history to the most recent messages."""
-    if len(state.messages) > max_messages:
-        state.messages = state.messages[-max_messages:]
-    for message in state.messages:
-        if message.timestamp is None:
-            message.timestamp = datetime.now(timezone.utc)
+    state.trim_messages(max_messages)
+    # Messages are stamped when created, so only a trailing run can lack a timestamp
+    now = state.turn_timestamp()
+    for message in reversed(state.messages):
+        if message.timestamp is not None:
+            break
+        message.timestamp = now
     return state
 
 
@@ -21,11 +23,12 @@ def apply_long_term_memory(state: ConversationState, max_notes: int = 50) -> Con
     """Persist high-level notes from assistant messages."""
     if state.messages:
         latest = state.messages[-1]
-        if latest.message_type in {MessageType.ASSISTANT, MessageType.SYSTEM}:
+        if latest.message_type in _LONG_TERM_TYPES:
             note = latest.content.strip()
             if note:
-                state.long_term_notes.append(note)
-                if len(state.long_term_notes) > max_notes:
-                    state.long_term_notes = state.long_term_notes[-max_notes:]
+                notes = state.long_term_notes
+                notes.append(note)
+                if len(notes) > max_notes:
+                    del notes[:-max_notes]
     return state
 
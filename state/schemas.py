@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+_UTC = timezone.utc
 
 
 class MessageType(str, Enum):
@@ -20,6 +23,11 @@ class MessageType(str, Enum):
     TOOL = "tool"
 
 
+# Interned message_type strings for history views; a dict lookup also avoids
+# the Enum.value descriptor on every message.
+_MESSAGE_TYPE_NAMES = {member: sys.intern(member.value) for member in MessageType}
+
+
 class Message(BaseModel):
     """Single conversation message."""
 
@@ -29,6 +37,24 @@ class Message(BaseModel):
     message_type: MessageType = MessageType.USER
     metadata: Dict[str, str] = Field(default_factory=dict)
 
+    @classmethod
+    def internal(
+        cls,
+        role: str,
+        content: str,
+        message_type: MessageType,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> "Message":
+        """Build a message produced by graph nodes, skipping validation of known-good fields."""
+        return cls.model_construct(
+            role=role,
+            content=content,
+            timestamp=timestamp,
+            message_type=message_type,
+            metadata=metadata or {},
+        )
+
 
 class PlanDecision(str, Enum):
     """Possible planner decisions."""
@@ -42,6 +68,8 @@ class PlanDecision(str, Enum):
 class RetrievedDocument(BaseModel):
     """Document snippet retrieved for the current turn."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     source: Optional[str] = None
     score: Optional[float] = None
@@ -51,6 +79,9 @@ class RetrievedDocument(BaseModel):
 class ConversationState(BaseModel):
     """Conversation state shared across LangGraph nodes."""
 
+    # Grow by appending and shrink with trim_messages(). The history caches
+    # below check the list and its tail on every read and are rebuilt when
+    # either has changed, but edits further back are not detected.
     messages: List[Message] = Field(default_factory=list)
     lead_id: Optional[str] = None
     metadata: Dict[str, str] = Field(default_factory=dict)
@@ -62,3 +93,91 @@ class ConversationState(BaseModel):
     retrieved_context: List[RetrievedDocument] = Field(default_factory=list)
     long_term_notes: List[str] = Field(default_factory=list)
 
+    # (messages list, length already scanned, index of latest user message,
+    # last scanned message)
+    _user_scan: Optional[Tuple[List[Message], int, int, Optional[Message]]] = PrivateAttr(default=None)
+    _turn_started_at: Optional[datetime] = PrivateAttr(default=None)
+    # (messages list, chain-facing view of it kept in step by history_view(),
+    # last message converted into the view)
+    _history_view: Optional[Tuple[List[Message], List[Dict[str, str]], Optional[Message]]] = PrivateAttr(
+        default=None
+    )
+
+    def history_view(self) -> List[Dict[str, str]]:
+        """Return the history entries the chains read, converting only newly appended messages.
+
+        The returned list is shared between calls and must not be mutated.
+        """
+        messages = self.messages
+        cached = self._history_view
+        if (
+            cached is not None
+            and cached[0] is messages
+            and len(cached[1]) <= len(messages)
+            and (not cached[1] or messages[len(cached[1]) - 1] is cached[2])
+        ):
+            view = cached[1]
+        else:
+            # New list, or a cached message was replaced in place: rebuild
+            view = []
+        view.extend(
+            {
+                "role": message.role,
+                "message_type": _MESSAGE_TYPE_NAMES[message.message_type],
+                "content": message.content,
+            }
+            for message in messages[len(view):]
+        )
+        self._history_view = (messages, view, messages[-1] if messages else None)
+        return view
+
+    def trim_messages(self, max_messages: int) -> None:
+        """Drop the oldest messages in place, keeping the history caches in step.
+
+        Shrink the history through this method rather than deleting from
+        ``messages`` directly, which the caches cannot detect.
+        """
+        messages = self.messages
+        excess = len(messages) - max_messages
+        if excess <= 0:
+            return
+        del messages[:excess]
+        cached = self._history_view
+        if cached is not None and cached[0] is messages:
+            del cached[1][:excess]
+        scan = self._user_scan
+        if scan is not None and scan[0] is messages:
+            index = scan[2] - excess if scan[2] >= excess else -1
+            self._user_scan = (messages, max(scan[1] - excess, 0), index, scan[3])
+
+    def start_turn(self) -> None:
+        """Fix the timestamp used for messages produced during this turn."""
+        self._turn_started_at = datetime.now(_UTC)
+
+    def end_turn(self) -> None:
+        self._turn_started_at = None
+
+    def turn_timestamp(self) -> datetime:
+        """Timestamp for node-produced messages; the current time outside a turn."""
+        return self._turn_started_at or datetime.now(_UTC)
+
+    def last_user_message(self) -> Optional[str]:
+        """Return the latest user message content, scanning only messages added since the last call."""
+        messages = self.messages
+        start, index = 0, -1
+        scan = self._user_scan
+        if (
+            scan is not None
+            and scan[0] is messages
+            and scan[1] <= len(messages)
+            and (scan[1] == 0 or messages[scan[1] - 1] is scan[3])
+            and (scan[2] < 0 or messages[scan[2]].message_type is MessageType.USER)
+        ):
+            start, index = scan[1], scan[2]
+        for position in range(len(messages) - 1, start - 1, -1):
+            if messages[position].message_type is MessageType.USER:
+                index = position
+                break
+        self._user_scan = (messages, len(messages), index, messages[-1] if messages else None)
+        return messages[index].content if index >= 0 else None
+
@@ -6,6 +6,7 @@ from pathlib import Path
 import sys
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -17,9 +18,15 @@ os.environ.setdefault("JWT_SECRET_KEY", "development-jwt-secret-key-32-bytes!!")
 os.environ.setdefault("ENVIRONMENT", "test")
 
 from apps.api.main import app  # noqa: E402  # pylint: disable=wrong-import-position
+from tools import register_default_tools  # noqa: E402  # pylint: disable=wrong-import-position
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session", autouse=True)
+def default_tools() -> None:
+    register_default_tools()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app, raise_app_exceptions=False)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
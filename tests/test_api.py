@@ -1,35 +1,51 @@
 """Integration tests for FastAPI conversation endpoints."""
 
-import sys
-from pathlib import Path
-
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from apps.api.main import app  # type: ignore  # pylint: disable=import-error
-from tools import register_default_tools
-
-
-@pytest.mark.asyncio()
-async def test_conversation_flow() -> None:
-    register_default_tools()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        response = await client.post(
-            "/api/conversations/demo/messages",
-            json={"content": "Tell me about term life policies."},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["conversation_id"] == "demo"
-        assert data["messages"], "Expected messages in response"
-
-        get_response = await client.get("/api/conversations/demo")
-        assert get_response.status_code == 200
-        snapshot = get_response.json()
-        assert snapshot["messages"][-1]["message_type"] in {"assistant", "system", "tool"}
+from httpx import AsyncClient
+
+from apps.api.router import ConversationStore
+from config.cache import redis_manager
+
+
+async def test_conversation_flow(async_client: AsyncClient) -> None:
+    response = await async_client.post(
+        "/api/conversations/demo/messages",
+        json={"content": "Tell me about term life policies."},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["conversation_id"] == "demo"
+    assert data["messages"], "Expected messages in response"
+
+    get_response = await async_client.get("/api/conversations/demo")
+    assert get_response.status_code == 200
+    snapshot = get_response.json()
+    assert snapshot["messages"][-1]["message_type"] in {"assistant", "system", "tool"}
+
+
+async def test_conversation_rejects_non_string_metadata(async_client: AsyncClient) -> None:
+    response = await async_client.post(
+        "/api/conversations/bad-metadata/messages",
+        json={"content": "Hello", "metadata": {"age": 42}},
+    )
+    assert response.status_code == 422
+
+
+async def test_store_discards_invalid_persisted_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeRedis:
+        def __init__(self) -> None:
+            self.data = {"conv:stale": b'{"messages": [], "metadata": {"age": 42}}'}
+
+        async def get(self, key: str) -> bytes | None:
+            return self.data.get(key)
+
+        async def delete(self, key: str) -> None:
+            self.data.pop(key, None)
+
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_manager, "_client", fake)
+
+    state = await ConversationStore().get("stale")
 
+    assert state.messages == []
+    assert "conv:stale" not in fake.data
@@ -1,6 +1,7 @@
 """Tests for LangGraph integration scaffolding."""
 
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict
 
 import pytest
@@ -11,12 +12,14 @@ from chains.parsers import (
     RetrieverOutput,
     parse_planner_output,
 )
+from chains.runnables import PlannerInputs
 from graph import build_graph
 from graph.nodes import action as action_node
 from graph.nodes import decider as decider_node
 from graph.nodes import planner
 from graph.nodes import reflector as reflector_node
 from graph.nodes import retriever as retriever_node
+from state.checkpoints import CheckpointStore
 from state.schemas import (
     ConversationState,
     Message,
@@ -53,8 +56,10 @@ def test_plan_next_step_updates_state(monkeypatch: pytest.MonkeyPatch) -> None:
         pending_tool=None,
     )
 
+    fake_payload = fake_output.model_dump()
+
     def fake_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return fake_output.model_dump()
+        return fake_payload
 
     initial_state = ConversationState(
         messages=[
@@ -170,14 +175,20 @@ def test_planner_retriever_action_integration(monkeypatch: pytest.MonkeyPatch) -
         confidence=0.8,
     )
 
+    planner_payload = planner_output.model_dump()
+
     def fake_planner_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return planner_output.model_dump()
+        return planner_payload
+
+    retriever_payload = retriever_output.model_dump()
 
     def fake_retriever_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return retriever_output.model_dump()
+        return retriever_payload
+
+    action_payload = action_output.model_dump()
 
     def fake_action_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return action_output.model_dump()
+        return action_payload
 
     state = ConversationState(
         messages=[
@@ -224,14 +235,20 @@ def test_conversation_graph_run_turn() -> None:
         confidence=0.7,
     )
 
+    planner_payload = planner_output.model_dump()
+
     def fake_planner_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return planner_output.model_dump()
+        return planner_payload
+
+    retriever_payload = retriever_output.model_dump()
 
     def fake_retriever_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return retriever_output.model_dump()
+        return retriever_payload
+
+    action_payload = action_output.model_dump()
 
     def fake_action_chain(_: Dict[str, Any]) -> Dict[str, Any]:
-        return action_output.model_dump()
+        return action_payload
 
     graph = build_graph.build_conversation_graph(
         planner_chain=fake_planner_chain,
@@ -257,3 +274,136 @@ def test_conversation_graph_run_turn() -> None:
     assert updated_state.messages[-1].message_type in {MessageType.SYSTEM, MessageType.ASSISTANT}
     assert any(msg.message_type is MessageType.SYSTEM for msg in updated_state.messages)
 
+
+
+def test_turn_cache_replays_identical_state() -> None:
+    calls = []
+    planner_output = PlannerOutput(
+        decision=PlanDecision.CONTINUE,
+        rationale="Respond directly.",
+        plan_steps=["Respond"],
+        pending_tool=None,
+    )
+
+    planner_payload = planner_output.model_dump()
+
+    def counting_planner_chain(_: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        return planner_payload
+
+    graph = build_graph.build_conversation_graph(
+        planner_chain=counting_planner_chain,
+        action_chain=lambda _: {"message": "Sure.", "tool_call": None},
+        turn_cache_size=2,
+    )
+
+    def make_state() -> ConversationState:
+        return ConversationState(
+            messages=[
+                Message(
+                    role="user",
+                    content="Hello",
+                    timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    message_type=MessageType.USER,
+                )
+            ],
+        )
+
+    first = graph.run_turn(make_state())
+    second = graph.run_turn(make_state())
+
+    assert len(calls) == 1
+    assert second.model_dump() == first.model_dump()
+
+
+def test_checkpoint_store_roundtrip(tmp_path: Path) -> None:
+    store = CheckpointStore(maxsize=2)
+    state = ConversationState(
+        messages=[
+            Message(
+                role="user",
+                content="Hello",
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                message_type=MessageType.USER,
+            )
+        ],
+        next_action=PlanDecision.CONTINUE,
+    )
+    store.snapshot("a", state)
+    store.snapshot("b", state)
+    store.snapshot("c", state)
+    assert store.resume("a") is None
+
+    path = tmp_path / "checkpoints.json"
+    store.save(path)
+    loaded = CheckpointStore.load(path, maxsize=2)
+    assert len(loaded) == 2
+    assert loaded.resume("c").model_dump() == state.model_dump()
+
+
+def test_history_view_rebuilds_after_tail_replacement() -> None:
+    state = ConversationState(
+        messages=[Message(role="user", content="Hello", message_type=MessageType.USER)]
+    )
+    view = state.history_view()
+    PlannerInputs(history=view).as_dict()["history"].clear()
+    assert state.history_view() == view and len(view) == 1
+
+    state.messages[-1] = Message(role="user", content="Hi there", message_type=MessageType.USER)
+    assert state.history_view()[-1]["content"] == "Hi there"
+
+
+def test_last_user_message_revalidates_cached_index() -> None:
+    state = ConversationState(
+        messages=[Message(role="user", content="Hello", message_type=MessageType.USER)]
+    )
+    assert state.last_user_message() == "Hello"
+
+    state.messages[-1] = Message(role="assistant", content="Hi", message_type=MessageType.ASSISTANT)
+    assert state.last_user_message() is None
+
+    state.messages[-1] = Message(role="user", content="Quote please", message_type=MessageType.USER)
+    assert state.last_user_message() == "Quote please"
+
+
+def test_turn_cache_skips_unserializable_state() -> None:
+    graph = build_graph.build_conversation_graph(
+        planner_chain=lambda _: {"decision": "continue", "rationale": "Respond.", "plan_steps": []},
+        action_chain=lambda _: {"message": "Sure.", "tool_call": None},
+        turn_cache_size=2,
+    )
+    state = ConversationState(
+        messages=[Message(role="user", content="Hello", message_type=MessageType.USER)]
+    )
+    state.metadata["session"] = object()
+
+    result = graph.run_turn(state)
+
+    assert result.messages[-1].content == "Sure."
+    assert len(graph.checkpoints) == 0
+
+
+def test_injected_action_chain_receives_dicts() -> None:
+    seen: Dict[str, Any] = {}
+
+    def injected_action_chain(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        seen["sources"] = [doc["source"] for doc in inputs["retrieved_context"]]
+        seen["timestamp"] = inputs["history"][-1]["timestamp"]
+        return {"message": "Here is what I found.", "tool_call": None}
+
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    state = ConversationState(
+        messages=[
+            Message(
+                role="user",
+                content="Term life?",
+                timestamp=timestamp,
+                message_type=MessageType.USER,
+            )
+        ],
+        retrieved_context=[RetrievedDocument(content="Term life basics", source="kb/term.md")],
+    )
+
+    action_node.execute_action(state, chain=injected_action_chain)
+
+    assert seen == {"sources": ["kb/term.md"], "timestamp": timestamp}
@@ -24,22 +24,27 @@ SAMPLE_DOCS = [
 ]
 
 
-def test_ingest_and_retrieve_roundtrip() -> None:
+@pytest.fixture(scope="session")
+def sample_ingested() -> None:
     ingest.ingest_documents(SAMPLE_DOCS)
+
+
+def test_ingest_and_retrieve_roundtrip(sample_ingested: None) -> None:
     retriever_instance = retriever.get_retriever()
     results = retriever_instance("Tell me about term life", top_k=1)
     assert results, "Expected at least one retrieval result"
     assert results[0]["source"] == "kb/term_life.md"
 
 
-def test_get_retriever_without_documents_errors() -> None:
+def test_get_retriever_without_documents_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Empty a throwaway store so the session-wide sample documents survive
+    monkeypatch.setattr(ingest, "_DOCUMENT_STORE", [])
     ingest.ingest_documents([])
     with pytest.raises(ValueError):
         retriever.get_retriever()
 
 
-def test_retrieve_context_updates_state() -> None:
-    ingest.ingest_documents(SAMPLE_DOCS)
+def test_retrieve_context_updates_state(sample_ingested: None) -> None:
     state = ConversationState(
         messages=[
             Message(
@@ -68,3 +73,19 @@ def test_parse_retriever_output_handles_json() -> None:
     }
     parsed = parse_retriever_output(payload)
     assert parsed.results[0].content == "Sample content"
+
+
+def test_retrieve_context_without_category(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Throwaway store, version and cache so the session-wide sample documents survive
+    monkeypatch.setattr(ingest, "_DOCUMENT_STORE", [])
+    monkeypatch.setattr(ingest, "_STORE_VERSION", ingest.get_store_version())
+    monkeypatch.setattr(retriever, "_RETRIEVER_CACHE", None)
+    ingest.ingest_documents([("Riders extend term life coverage.", DocumentMetadata(source="a.md"))])
+
+    state = ConversationState(
+        messages=[Message(role="user", content="term life riders", message_type=MessageType.USER)]
+    )
+    retriever_node.retrieve_context(state)
+
+    assert state.retrieved_context[0].metadata == {"source": "a.md"}
+    ConversationState.model_validate_json(state.model_dump_json())
@@ -3,7 +3,7 @@
 import pytest
 
 from tools import register_default_tools
-from tools.mcp_client import execute_tool, list_tools, register_tool
+from tools.mcp_client import execute_tool, get_tool, has_tool, list_tools, register_tool
 
 
 def test_register_and_execute_custom_tool() -> None:
@@ -21,8 +21,19 @@ def test_default_policy_tools_available() -> None:
     assert "lookup_policy" in list_tools()
     payload = execute_tool("lookup_policy", {"policy_id": "term_basic"})
     assert payload["name"] == "Basic Term Life"
+    payload["name"] = "Changed"
+    assert execute_tool("lookup_policy", {"policy_id": "term_basic"})["name"] == "Basic Term Life"
+    assert execute_tool("list_policies", {}) == {"policies": ["term_basic", "whole_classic"]}
 
 
 def test_execute_unknown_tool_raises() -> None:
     with pytest.raises(ValueError):
         execute_tool("non_existent_tool", {})
+
+
+def test_tool_lookup_helpers() -> None:
+    register_default_tools()
+    assert has_tool("lookup_policy")
+    assert not has_tool("non_existent_tool")
+    assert callable(get_tool("lookup_policy"))
+    assert get_tool("non_existent_tool") is None
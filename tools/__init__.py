@@ -1,12 +1,14 @@
 """Tooling integrations (MCP clients, tool specs)."""
 
-from tools.mcp_client import execute_tool, list_tools, register_tool
+from tools.mcp_client import execute_tool, get_tool, has_tool, list_tools, register_tool
 from tools.policy_tools import register_default_tools
 
 __all__ = [
     "register_tool",
     "execute_tool",
     "list_tools",
+    "has_tool",
+    "get_tool",
     "register_default_tools",
 ]
 
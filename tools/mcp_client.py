@@ -24,14 +24,22 @@ class MCPClient:
     def list_tools(self) -> List[str]:
         return list(self._registry.keys())
 
+    def has_tool(self, name: str) -> bool:
+        return name in self._registry
+
+    __contains__ = has_tool
+
+    def get_tool(self, name: str) -> Optional[ToolCallable]:
+        return self._registry.get(name)
+
     def get_description(self, name: str) -> str:
         return self._metadata.get(name, "")
 
     def execute_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
-        if name not in self._registry:
+        func = self.get_tool(name)
+        if func is None:
             raise ValueError(f"Tool '{name}' is not registered.")
-        arguments = arguments or {}
-        return self._registry[name](arguments)
+        return func(arguments or {})
 
 
 _client = MCPClient()
@@ -49,6 +57,14 @@ def list_tools() -> List[str]:
     return _client.list_tools()
 
 
+def has_tool(name: str) -> bool:
+    return _client.has_tool(name)
+
+
+def get_tool(name: str) -> Optional[ToolCallable]:
+    return _client.get_tool(name)
+
+
 def get_tool_description(name: str) -> str:
     return _client.get_description(name)
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from tools.mcp_client import list_tools, register_tool
+from tools.mcp_client import has_tool, register_tool
 
 POLICY_DB: Dict[str, Dict[str, Any]] = {
     "term_basic": {
@@ -21,31 +21,35 @@ POLICY_DB: Dict[str, Dict[str, Any]] = {
     },
 }
 
+_POLICY_IDS = tuple(POLICY_DB)
+
 
 def lookup_policy(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Return policy details based on a policy identifier."""
     policy_id = arguments.get("policy_id")
     if not policy_id:
         raise ValueError("policy_id argument is required.")
-    if policy_id not in POLICY_DB:
+    policy = POLICY_DB.get(policy_id)
+    if policy is None:
         raise ValueError(f"Unknown policy_id '{policy_id}'.")
-    return POLICY_DB[policy_id]
+    # Copy so callers cannot modify the shared policy record
+    return dict(policy)
 
 
 def list_policy_ids(_: Dict[str, Any]) -> Dict[str, Any]:
     """Return available policy identifiers."""
-    return {"policies": list(POLICY_DB.keys())}
+    return {"policies": list(_POLICY_IDS)}
 
 
 def register_default_tools() -> None:
     """Register default development tools."""
-    if "lookup_policy" not in list_tools():
+    if not has_tool("lookup_policy"):
         register_tool(
             "lookup_policy",
             lookup_policy,
             description="Retrieve policy details by policy_id.",
         )
-    if "list_policies" not in list_tools():
+    if not has_tool("list_policies"):
         register_tool(
             "list_policies",
             list_policy_ids,